@@ -211,10 +211,11 @@ async def send_expiring_items_alert(
             message="No expiring items to alert about."
         )
 
-    # Convert to schema items
+    # Convert to schema items; rows come straight from the database, so
+    # skip validation
     from backend.models.schemas import FridgeItem
     schema_items = [
-        FridgeItem(
+        FridgeItem.model_construct(
             ingredient_name=item.ingredient_name,
             quantity=item.quantity,
             days_remaining=item.days_remaining,
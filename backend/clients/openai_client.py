@@ -4,9 +4,15 @@ OpenAI API client with retry logic and error handling.
 Provides a wrapper around the OpenAI API for LLM-powered step parsing.
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import orjson
+
+from backend.clients.rate_limiter import get_rate_limiter
 from backend.config import settings
 
 logger = logging.getLogger(__name__)
@@ -18,6 +24,70 @@ class OpenAIClientError(Exception):
     pass
 
 
+def _log_usage(usage: Any) -> None:
+    """Log a request's token usage, including prompt tokens served from OpenAI's prompt cache."""
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+    logger.debug(
+        f"OpenAI usage: {usage.prompt_tokens} prompt tokens ({cached_tokens} cached), "
+        f"{usage.completion_tokens} completion tokens"
+    )
+
+
+def _iter_json_array_items(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """
+    Yield the items of a top-level JSON array as its text arrives in chunks.
+
+    Each item is decoded as soon as it is complete, and text that has been
+    decoded is dropped from the buffer, so callers can start working on
+    early items while later ones are still being received.
+
+    Raises:
+        OpenAIClientError: If the text ends before the array is closed.
+    """
+    decoder = json.JSONDecoder()
+    array_start = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+    buffer = ""
+    pos: Optional[int] = None  # Position just past the last decoded item
+
+    for chunk in chunks:
+        buffer += chunk
+        if pos is None:
+            match = array_start.search(buffer)
+            if not match:
+                continue
+            pos = match.end()
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Item is still incomplete, wait for more text
+            yield item
+
+        buffer = buffer[pos:]
+        pos = 0
+
+    if pos is not None:
+        raise OpenAIClientError(f"JSON response ended inside the {key!r} array")
+
+    # The array never started, e.g. the key is missing or the array is
+    # empty but formatted unusually; decode the whole response instead
+    try:
+        data = orjson.loads(buffer)
+    except orjson.JSONDecodeError as e:
+        raise OpenAIClientError(f"Failed to parse JSON response: {e}") from e
+    yield from (data.get(key) or []) if isinstance(data, dict) else []
+
+
 class OpenAIClient:
     """
     Client for interacting with OpenAI API.
@@ -40,6 +110,7 @@ class OpenAIClient:
         """Initialize the OpenAI client."""
         self._client: Optional[Any] = None
         self._initialized = False
+        self._rate_limiter = get_rate_limiter()
 
     def _ensure_initialized(self) -> None:
         """Lazily initialize the OpenAI client."""
@@ -63,9 +134,24 @@ class OpenAIClient:
             self._initialized = True
         except ImportError:
             raise OpenAIClientError(
-                "openai package not installed. Run: pip install openai>=1.10.0"
+                "openai package not installed. Run: pip install openai>=1.26.0"
             )
 
+    def _wait_for_rate_limit(self, system_prompt: str, user_prompt: str) -> None:
+        """Wait until the rate limiter has room for a request with these prompts."""
+        if self._rate_limiter:
+            # Roughly four characters per token for English text
+            self._rate_limiter.acquire((len(system_prompt) + len(user_prompt)) // 4)
+
+    def _record_request_outcome(self, error: Optional[Exception] = None) -> None:
+        """Let the rate limiter adapt to whether the API accepted a request."""
+        if not self._rate_limiter:
+            return
+        if error is None:
+            self._rate_limiter.record_success()
+        elif getattr(error, "status_code", None) == 429:
+            self._rate_limiter.record_rate_limited()
+
     def complete(
         self,
         system_prompt: str,
@@ -103,10 +189,14 @@ class OpenAIClient:
             if response_format:
                 kwargs["response_format"] = response_format
 
+            self._wait_for_rate_limit(system_prompt, user_prompt)
             response = self._client.chat.completions.create(**kwargs)
+            self._record_request_outcome()
+            _log_usage(response.usage)
             return response.choices[0].message.content
 
         except Exception as e:
+            self._record_request_outcome(e)
             logger.error(f"OpenAI API call failed: {e}")
             raise OpenAIClientError(f"OpenAI API call failed: {e}") from e
 
@@ -130,8 +220,6 @@ class OpenAIClient:
         Raises:
             OpenAIClientError: If the API call fails or JSON parsing fails.
         """
-        import json
-
         response = self.complete(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
@@ -139,7 +227,160 @@ class OpenAIClient:
         )
 
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             raise OpenAIClientError(f"Failed to parse JSON response: {e}") from e
+
+    def stream_json_items(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        key: str,
+    ) -> Iterator[Any]:
+        """
+        Stream a JSON completion and yield the items of one array as they arrive.
+
+        Unlike parse_json(), items can be processed while the rest of the
+        response is still being generated, and the request timeout applies
+        between chunks rather than to the whole response, so long replies
+        don't time out.
+
+        Args:
+            system_prompt: Instructions for the model behavior.
+            user_prompt: The user's input to process.
+            key: Top-level key of the array to stream, e.g. "parsed_steps".
+
+        Yields:
+            Each decoded item of the array, in order.
+
+        Raises:
+            OpenAIClientError: If the API call fails or the JSON is malformed.
+        """
+        self._ensure_initialized()
+
+        try:
+            self._wait_for_rate_limit(system_prompt, user_prompt)
+            stream = self._client.chat.completions.create(
+                model=settings.openai_model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=settings.openai_temperature,
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            self._record_request_outcome()
+
+            def content_chunks() -> Iterator[str]:
+                for chunk in stream:
+                    # Usage arrives in a final chunk with no choices
+                    if chunk.usage:
+                        _log_usage(chunk.usage)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            chunks = content_chunks()
+            yield from _iter_json_array_items(chunks, key)
+            # Read the rest of the stream for its usage chunk
+            for _ in chunks:
+                pass
+
+        except OpenAIClientError:
+            raise
+        except Exception as e:
+            self._record_request_outcome(e)
+            logger.error(f"OpenAI streaming call failed: {e}")
+            raise OpenAIClientError(f"OpenAI streaming call failed: {e}") from e
+
+    def parse_json_batch(
+        self,
+        system_prompt: str,
+        user_prompts: Dict[str, str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run JSON completions through the OpenAI Batch API and wait for them.
+
+        The Batch API is billed at half the price of synchronous calls and
+        has its own rate limits, but takes minutes to hours to complete, so
+        this is only for work that is not waiting on a user.
+
+        Args:
+            system_prompt: Instructions for the model behavior, shared by all requests.
+            user_prompts: User prompt for each request, keyed by a caller-chosen ID.
+
+        Returns:
+            Parsed JSON response for each request ID that succeeded. Requests
+            that failed or returned invalid JSON are left out.
+
+        Raises:
+            OpenAIClientError: If the batch can't be submitted or doesn't complete.
+        """
+        self._ensure_initialized()
+
+        lines = [
+            orjson.dumps({
+                "custom_id": request_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.openai_model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "temperature": settings.openai_temperature,
+                    "response_format": {"type": "json_object"},
+                },
+            })
+            for request_id, user_prompt in user_prompts.items()
+        ]
+
+        try:
+            input_file = self._client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = self._client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+
+            # Poll with exponential backoff until the batch reaches a final state
+            delay = settings.openai_batch_poll_min_seconds
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(delay)
+                delay = min(delay * 2, settings.openai_batch_poll_max_seconds)
+                batch = self._client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise OpenAIClientError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+            output = self._client.files.content(batch.output_file_id).content
+
+        except OpenAIClientError:
+            raise
+        except Exception as e:
+            logger.error(f"OpenAI batch failed: {e}")
+            raise OpenAIClientError(f"OpenAI batch failed: {e}") from e
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[record["custom_id"]] = orjson.loads(content)
+            except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable batch result: {e}")
+
+        return results
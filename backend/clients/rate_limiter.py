@@ -0,0 +1,119 @@
+"""
+Client-side rate limiting for OpenAI requests.
+
+Paces requests against the account's requests-per-minute and
+tokens-per-minute limits before they are sent, so parallel parsing
+waits briefly instead of collecting 429 responses and backing off.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute, shared across threads.
+
+    Both buckets start full and refill continuously at their per-minute
+    rate. acquire() blocks until both have room for the request. When the
+    API still answers 429, the request rate is halved, and it then creeps
+    back up by one request per minute with each successful call.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute.
+            tokens_per_minute: Maximum (estimated) tokens per minute.
+        """
+        self._max_requests_per_minute = float(requests_per_minute)
+        self._requests_per_minute = float(requests_per_minute)
+        self._tokens_per_minute = float(tokens_per_minute)
+        self._request_budget = self._requests_per_minute
+        self._token_budget = self._tokens_per_minute
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time since the last refill."""
+        now = time.monotonic()
+        minutes = (now - self._updated_at) / 60
+        self._updated_at = now
+        self._request_budget = min(
+            self._requests_per_minute,
+            self._request_budget + minutes * self._requests_per_minute,
+        )
+        self._token_budget = min(
+            self._tokens_per_minute,
+            self._token_budget + minutes * self._tokens_per_minute,
+        )
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until a request of the given size fits within both limits.
+
+        Args:
+            tokens: Estimated tokens the request will use.
+        """
+        # A request bigger than the whole bucket can only wait for a full one
+        tokens = min(tokens, self._tokens_per_minute)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._request_budget >= 1 and self._token_budget >= tokens:
+                    self._request_budget -= 1
+                    self._token_budget -= tokens
+                    return
+                wait_seconds = 60 * max(
+                    (1 - self._request_budget) / self._requests_per_minute,
+                    (tokens - self._token_budget) / self._tokens_per_minute,
+                )
+            time.sleep(wait_seconds)
+
+    def record_success(self) -> None:
+        """Recover the request rate after an earlier 429."""
+        with self._lock:
+            if self._requests_per_minute < self._max_requests_per_minute:
+                self._requests_per_minute = min(
+                    self._max_requests_per_minute, self._requests_per_minute + 1
+                )
+
+    def record_rate_limited(self) -> None:
+        """Halve the request rate and drain the request bucket after a 429."""
+        with self._lock:
+            self._requests_per_minute = max(1.0, self._requests_per_minute / 2)
+            self._request_budget = 0.0
+            logger.warning(
+                f"OpenAI rate limit hit, pacing requests at "
+                f"{self._requests_per_minute:.0f}/min"
+            )
+
+
+# Global rate limiter instance
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get or create the global OpenAI rate limiter.
+
+    Returns:
+        The shared limiter, or None if rate limiting is disabled in settings.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        if settings.openai_requests_per_minute <= 0 or settings.openai_tokens_per_minute <= 0:
+            return None
+        _rate_limiter = RateLimiter(
+            settings.openai_requests_per_minute,
+            settings.openai_tokens_per_minute,
+        )
+    return _rate_limiter
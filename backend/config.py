@@ -90,6 +90,9 @@ class Settings(BaseSettings):
     # Background jobs
     enable_background_jobs: bool = True
     freshness_decay_hour: int = 0  # Run at midnight
+    freshness_decay_batch_size: int = 5000  # Fridge items per decay UPDATE
+    expired_items_cleanup_batch_size: int = 10000  # Expired fridge items per cleanup DELETE
+    prep_precompute_hour: int = 1  # Batch-parse upcoming plans' recipes at 1 AM
 
     # Email configuration
     smtp_server: str = "smtp.gmail.com"
@@ -99,6 +102,7 @@ class Settings(BaseSettings):
     email_from_address: str = "noreply@preppilot.app"
     email_from_name: str = "PrepPilot"
     email_enabled: bool = False  # Disabled by default until configured
+    email_max_concurrency: int = 16  # Parallel SMTP sends for bulk alert jobs
 
     # Email retry configuration
     email_max_retries: int = 3  # Maximum retry attempts
@@ -112,9 +116,17 @@ class Settings(BaseSettings):
     openai_timeout_seconds: int = 30  # Request timeout
     openai_temperature: float = 0.1  # Low temperature for consistent parsing
     openai_max_retries: int = 3  # Retry attempts for transient failures
+    openai_stream_responses: bool = True  # Disable for endpoints without streaming support
+    openai_max_concurrency: int = 8  # Parallel parsing requests when a batch needs several
+    openai_requests_per_minute: int = 500  # Client-side request pacing; 0 disables rate limiting
+    openai_tokens_per_minute: int = 30000  # Client-side token pacing, estimated from prompt length
+    openai_batch_poll_min_seconds: int = 10  # First Batch API status poll delay
+    openai_batch_poll_max_seconds: int = 300  # Backoff cap between Batch API status polls
 
     # Step parsing cache configuration
     step_parsing_cache_ttl_hours: int = 24  # How long to cache parsed steps
+    # Heuristic parses at or above this confidence skip the LLM; above 1.0 sends every step
+    step_parsing_heuristic_confidence: float = 0.8
 
     model_config = SettingsConfigDict(
         env_file=_BACKEND_DIR / ".env",
@@ -194,11 +194,8 @@ class AdaptivePlanner:
         # Analyze current fridge situation
         fridge_analysis = self.analyze_fridge_situation(user_id, current_date)
 
-        # Get pending meals (not yet completed)
-        pending_meals = current_plan.get_pending_meals()
-
-        # Filter to future meals only
-        future_meals = [m for m in pending_meals if m.date >= current_date]
+        # Get pending (not yet completed) meals from today onwards
+        future_meals = [m for m in current_plan.iter_pending_meals() if m.date >= current_date]
 
         # If no missed preps and no expiring ingredients, return original plan
         if not input_data.missed_preps and not fridge_analysis["expiring_urgent"]:
@@ -228,7 +225,9 @@ class AdaptivePlanner:
 
         # Process future meals
         for i, meal in enumerate(sorted(future_meals, key=lambda m: (m.date, m.meal_type))):
-            adapted_meal = meal.model_copy(deep=True)
+            # Shallow copy: adaptations replace the recipe rather than edit it,
+            # so the copy can share the original's Recipe and ingredients
+            adapted_meal = meal.model_copy()
 
             # Strategy 1: If we have urgent expiring ingredients, try to use them
             if urgent_ingredients and meal.date == current_date:
@@ -2,13 +2,15 @@
 In-memory cache for parsed steps.
 
 Caches ParsedPrepStep results to avoid redundant LLM calls for the same steps.
+Entries are keyed on the step text itself, so a step shared by many recipes
+("Dice the onion.") is parsed once.
 """
 
 import hashlib
 import logging
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from backend.config import settings
 from backend.engine.parsing.models import ParsedPrepStep
@@ -16,6 +18,11 @@ from backend.engine.parsing.models import ParsedPrepStep
 logger = logging.getLogger(__name__)
 
 
+def normalize_step_text(step_text: str) -> str:
+    """Normalize step text for matching: lowercased, whitespace collapsed."""
+    return " ".join(step_text.lower().split())
+
+
 @dataclass
 class CacheEntry:
     """A cached parsed step with expiration time."""
@@ -28,8 +35,10 @@ class StepParsingCache:
     """
     In-memory cache for parsed recipe steps.
 
-    Keys are generated from the hash of recipe_id + step_text.
-    Entries expire after the configured TTL (default: 24 hours).
+    Keys are generated from the hash of the prompt version and the
+    normalized step text (lowercased, whitespace collapsed), so identical
+    steps in different recipes share an entry and prompt changes start
+    from an empty cache. Entries expire after the configured TTL (default: 24 hours).
 
     Note: This is a simple in-memory cache. For multi-worker deployments,
     consider upgrading to Redis.
@@ -47,23 +56,26 @@ class StepParsingCache:
             ttl_hours or settings.step_parsing_cache_ttl_hours
         ) * 3600
 
-    def _generate_key(self, recipe_id: str, step_text: str) -> str:
-        """Generate a cache key from recipe ID and step text."""
-        content = f"{recipe_id}:{step_text}"
-        return hashlib.sha256(content.encode()).hexdigest()[:32]
+    def _generate_key(self, step_text: str, prompt_version: str) -> str:
+        """Generate a cache key from the prompt version and normalized step text."""
+        content = f"{prompt_version}:{normalize_step_text(step_text)}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
-    def get(self, recipe_id: str, step_text: str) -> Optional[ParsedPrepStep]:
+    def get(self, step_text: str, prompt_version: str) -> Optional[ParsedPrepStep]:
         """
         Get a cached parsed step if available and not expired.
 
+        The entry may have been stored for the same step in another recipe,
+        so its raw_step can differ in case or spacing from step_text.
+
         Args:
-            recipe_id: The recipe identifier.
             step_text: The raw step text.
+            prompt_version: Version of the prompt that produced the entry.
 
         Returns:
             The cached ParsedPrepStep or None if not found/expired.
         """
-        key = self._generate_key(recipe_id, step_text)
+        key = self._generate_key(step_text, prompt_version)
         entry = self._cache.get(key)
 
         if entry is None:
@@ -77,16 +89,31 @@ class StepParsingCache:
         logger.debug(f"Cache hit for step: {step_text[:50]}...")
         return entry.parsed_step
 
-    def set(self, recipe_id: str, step_text: str, parsed_step: ParsedPrepStep) -> None:
+    def get_many(
+        self, step_texts: List[str], prompt_version: str
+    ) -> List[Optional[ParsedPrepStep]]:
+        """
+        Get cached parsed steps for several steps at once.
+
+        Args:
+            step_texts: The raw step texts.
+            prompt_version: Version of the prompt that produced the entries.
+
+        Returns:
+            The cached ParsedPrepStep or None for each step, in order.
+        """
+        return [self.get(step_text, prompt_version) for step_text in step_texts]
+
+    def set(self, step_text: str, prompt_version: str, parsed_step: ParsedPrepStep) -> None:
         """
         Cache a parsed step.
 
         Args:
-            recipe_id: The recipe identifier.
             step_text: The raw step text.
+            prompt_version: Version of the prompt that produced the result.
             parsed_step: The parsed step to cache.
         """
-        key = self._generate_key(recipe_id, step_text)
+        key = self._generate_key(step_text, prompt_version)
         expires_at = time.time() + self._ttl_seconds
 
         self._cache[key] = CacheEntry(
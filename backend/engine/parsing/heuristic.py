@@ -10,11 +10,76 @@ While less accurate than LLM parsing for semantic normalization,
 it's fast, free, and works offline.
 """
 
+import bisect
+import functools
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from backend.engine.parsing.models import Equipment, ParsedPrepStep, Phase
 
+# Separator used to lowercase a whole batch of steps in one pass. NUL never
+# appears in recipe text and is not whitespace, a digit, or a word character,
+# so none of the keyword or time patterns can match across it.
+_BATCH_SEP = "\x00"
+
+# Explicit time mentions; group 2 is set for minutes, unset for hours.
+# Minutes win over hours when a step mentions both.
+_TIME_RE = re.compile(r"(\d+)\s*(?:(min)|hour)")
+
+
+# A whitespace-delimited word that doesn't start with a digit, without its
+# trailing punctuation (the word itself is group 0)
+_INGREDIENT_WORD_RE = re.compile(r"(?<!\S)[^\s\d]\S*?(?=[.,;:]*(?!\S))")
+
+# Parenthetical asides, dropped before looking for the ingredient
+_PARENTHETICAL_RE = re.compile(r"\([^)]*\)")
+
+
+# Feature bits set by HeuristicStepParser._feature_bits, one per keyword category
+_OVEN_BIT = 1 << 0
+_STOVETOP_BIT = 1 << 1
+_HANDS_FREE_BIT = 1 << 2
+_EQUIPMENT_MASK = _OVEN_BIT | _STOVETOP_BIT | _HANDS_FREE_BIT
+_FINISHING_BIT = 1 << 3
+_COOKING_BIT = 1 << 4
+_PHASE_SHIFT = 3
+_PASSIVE_BIT = 1 << 5
+
+# Equipment for every combination of equipment bits, encoding the priority
+# oven > stovetop > hands-free > prep area
+_EQUIPMENT_BY_BITS = tuple(
+    Equipment.OVEN if bits & _OVEN_BIT
+    else Equipment.STOVETOP if bits & _STOVETOP_BIT
+    else Equipment.HANDS_FREE if bits & _HANDS_FREE_BIT
+    else Equipment.PREP_AREA
+    for bits in range(_EQUIPMENT_MASK + 1)
+)
+
+# Phase for every combination of (cooking, finishing) bits, finishing first.
+# None means no phase keyword matched and the step position decides.
+_PHASE_BY_BITS = (None, Phase.FINISHING, Phase.COOKING, Phase.FINISHING)
+
+
+def _keyword_owners(keywords_by_type: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map each keyword to the first action type that lists it."""
+    owners: Dict[str, str] = {}
+    for action_type, keywords in keywords_by_type.items():
+        for keyword in keywords:
+            owners.setdefault(keyword, action_type)
+    return owners
+
+
+def _compile_longest_first(keywords) -> re.Pattern:
+    """
+    Compile keywords into one alternation, longest keyword first.
+
+    re tries alternatives left to right, so at the leftmost match position
+    the longest keyword wins ("preheat oven" over "heat ", "bring to a boil"
+    over "boil"). Ties keep their original order.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
 
 class HeuristicStepParser:
     """
@@ -125,8 +190,13 @@ class HeuristicStepParser:
         "finish": ["finish with", "finish"],
     }
 
+    # Keyword -> action type, and a single pattern that finds the leftmost,
+    # longest action keyword in one scan
+    _ACTION_TYPE_BY_KEYWORD = _keyword_owners(ACTION_KEYWORDS)
+    _ACTION_RE = _compile_longest_first(_ACTION_TYPE_BY_KEYWORD)
+
     # Keywords that indicate passive steps (no active attention needed)
-    PASSIVE_KEYWORDS = [
+    PASSIVE_KEYWORDS = (
         # Long cooking without stirring
         "simmer", "bake", "roast", "braise", "stew",
         # Resting/waiting
@@ -144,41 +214,53 @@ class HeuristicStepParser:
         "for 15 minutes", "for 20 minutes", "for 30 minutes",
         "for 40 minutes", "for 45 minutes", "for 1 hour",
         "for 90 minutes", "undisturbed",
-    ]
+    )
 
     # Equipment detection keywords
-    OVEN_KEYWORDS = [
+    # Temperatures are not keywords: steps are lowercased before matching,
+    # and a bare temperature doesn't identify the appliance ("toast millet in
+    # a saucepan (about 325°F)" is stovetop, "roast at 325°F" is oven)
+    OVEN_KEYWORDS = (
         "oven", "bake", "roast", "broil", "preheat", "baking sheet",
-        "baking dish", "roasting", "425°F", "400°F", "350°F", "325°F"
-    ]
-    STOVETOP_KEYWORDS = [
+        "baking dish", "roasting",
+    )
+    STOVETOP_KEYWORDS = (
         "simmer", "boil", "sauté", "saute", "fry", "pan", "stove",
         "heat", "burner", "skillet", "pot", "wok", "saucepan",
         "medium heat", "high heat", "low heat", "medium-high",
         "cook", "render", "sear", "brown",  # Active cooking keywords
-        "375°F", "325°F", "450°F", "500°F"
-    ]
-    HANDS_FREE_KEYWORDS = [
+    )
+    HANDS_FREE_KEYWORDS = (
         "rest", "marinate", "chill", "refrigerate", "cool",
         "let sit", "let stand", "leave at room temperature",
         "let batter rest", "freeze"
-    ]
+    )
 
     # Phase detection keywords
-    COOKING_KEYWORDS = [
+    COOKING_KEYWORDS = (
         "cook", "bake", "roast", "simmer", "boil", "fry", "sauté",
         "saute", "heat", "sear", "brown", "render", "braise", "stew",
         "char", "grill", "steam", "poach"
-    ]
-    FINISHING_KEYWORDS = [
+    )
+    FINISHING_KEYWORDS = (
         "serve", "plate", "garnish", "top with", "drizzle",
         "sprinkle over", "finish with", "arrange"
-    ]
+    )
+
+    # One pattern per keyword category; a search hit sets that category's bit
+    _FEATURE_PATTERNS = (
+        (_compile_longest_first(OVEN_KEYWORDS), _OVEN_BIT),
+        (_compile_longest_first(STOVETOP_KEYWORDS), _STOVETOP_BIT),
+        (_compile_longest_first(HANDS_FREE_KEYWORDS), _HANDS_FREE_BIT),
+        (_compile_longest_first(FINISHING_KEYWORDS), _FINISHING_BIT),
+        (_compile_longest_first(COOKING_KEYWORDS), _COOKING_BIT),
+        (_compile_longest_first(PASSIVE_KEYWORDS), _PASSIVE_BIT),
+    )
 
     # Patterns indicating descriptive/explanatory text (not actionable steps)
     # These are sentences that describe what happens or explain cooking theory,
     # but don't provide actionable instructions.
-    DESCRIPTIVE_STARTERS = [
+    DESCRIPTIVE_STARTERS = (
         "the heat will",
         "the apples will",
         "the apple will",
@@ -192,16 +274,76 @@ class HeuristicStepParser:
         "the apple acid",
         "the apples act",
         "the apple acts",
-    ]
+    )
+    # Verbs that mark a "The X ..." sentence as describing an outcome
+    DESCRIPTIVE_VERBS = (
+        " will ", " provides ", " provide ", " acts as ",
+        " act as ", " serves as ", " is key", " is the ",
+        " gives ", " brings ", " creates ", " softens ",
+        " dissolves ", " mimics ",
+    )
+    # Both checks as one anchored pattern: a known starter, or "the " followed
+    # anywhere by a descriptive verb
+    _DESCRIPTIVE_RE = re.compile(
+        "|".join(re.escape(starter) for starter in DESCRIPTIVE_STARTERS)
+        + "|the .*?(?:"
+        + "|".join(re.escape(verb) for verb in DESCRIPTIVE_VERBS)
+        + ")",
+        re.DOTALL,
+    )
 
     # Quick actions that take minimal time (1-2 minutes)
-    QUICK_ACTION_KEYWORDS = [
-        "place", "arrange", "lay", "set", "put", "position",
-        "pour", "drizzle", "add", "drop", "tuck", "thread",
-        "crack", "flip", "turn", "transfer", "remove from",
-        "take out", "push to the side", "push aside",
-        "return to", "stir in", "fold in", "sprinkle",
-    ]
+    QUICK_ACTION_KEYWORDS = (
+        "add", "turn", "place", "pour", "crack", "flip", "stir in", "lay",
+        "set", "arrange", "drizzle", "drop", "tuck", "thread", "transfer",
+        "remove from", "sprinkle", "put", "position", "take out",
+        "push to the side", "push aside", "return to", "fold in",
+    )
+
+    # Duration estimates in minutes, checked top to bottom: the first rung
+    # with a keyword in the step wins. Quick actions only count when no
+    # cooking is involved, which the ordering gives for free since every
+    # cooking keyword sits on an earlier rung.
+    DURATION_RULES = (
+        # Long passive cooking
+        (("roast", "bake"), 30),
+        (("slow", "slowly"), 15),
+        (("braise",), 20),
+        # Medium-length cooking
+        (("simmer",), 15),
+        (("cook",), 10),
+        (("render",), 10),
+        # Quick cooking
+        (("brown", "sear", "fry", "char"), 5),
+        (("sauté", "saute"), 5),
+        # Prep work
+        (("slice", "chop", "dice", "mince", "cube"), 3),
+        (("rinse", "wash"), 2),
+        (("peel", "core", "trim"), 2),
+        (("mix", "toss", "stir", "whisk", "combine"), 2),
+        (("grate", "julienne", "zest"), 2),
+        (("salt", "season"), 1),
+        # Quick actions (30 sec - 1 min, round up to 1)
+        (QUICK_ACTION_KEYWORDS, 1),
+        # Waiting/resting
+        (("rest", "let sit", "marinate"), 10),
+        # Preheating
+        (("preheat",), 5),
+        # Serving/plating
+        (("serve", "garnish", "plate"), 2),
+    )
+
+    # DURATION_RULES flattened to (keyword, minutes) pairs in rung order
+    _DURATION_BY_KEYWORD = tuple(
+        (keyword, minutes)
+        for keywords, minutes in DURATION_RULES
+        for keyword in keywords
+    )
+
+    # Actions the keyword rules classify reliably: equipment, phase, and
+    # passivity follow from the keyword, and they never batch, so there is
+    # no ingredient to normalize
+    CONFIDENT_ACTIONS = frozenset({"preheat", "rest", "serve"})
 
     # Words to filter out when extracting ingredients
     FILTER_WORDS = {
@@ -249,36 +391,47 @@ class HeuristicStepParser:
             ParsedPrepStep with extracted action_type, ingredient, equipment, etc.
         """
         step_lower = step.lower()
-
-        # Check if this is descriptive/explanatory text (not actionable)
-        if self._is_descriptive_text(step_lower):
-            return ParsedPrepStep(
-                action_type="descriptive",
-                ingredient="",
-                can_batch=False,
-                equipment=Equipment.HANDS_FREE,
-                is_passive=True,
-                phase=Phase.FINISHING,
-                duration_minutes=0,
-                raw_step=step,
-                parse_source="heuristic",
-            )
-
-        action_type = self._extract_action_type(step_lower)
-        ingredient = self._extract_ingredient(step_lower, action_type)
-        equipment = self._detect_equipment(step_lower)
-        is_passive = self._is_passive(step_lower)
-        phase = self._detect_phase(
+        return self._parse_step_fast(
+            step,
             step_lower,
+            context.get("recipe_total_time", 30),
+            context.get("total_steps", 1),
             context.get("step_index", 0),
-            context.get("total_steps", 1)
+            self._explicit_duration(step_lower),
         )
-        duration = self._estimate_duration(
+
+    def _parse_step_fast(
+        self,
+        step: str,
+        step_lower: str,
+        recipe_total_time: int,
+        total_steps: int,
+        step_index: int,
+        explicit_duration: Optional[int],
+    ) -> ParsedPrepStep:
+        """
+        Parse a step from positional context values.
+
+        parse_steps resolves the context once per recipe and calls this
+        directly, so no per-step context dict is built or read.
+        explicit_duration is the time stated in the step, if any, and
+        overrides the keyword-based estimate.
+        """
+        (
+            action_type,
+            ingredient,
+            can_batch,
+            equipment,
+            is_passive,
+            phase,
+            duration,
+        ) = self._classify(
             step_lower,
-            context.get("recipe_total_time", 30),
-            context.get("total_steps", 1),
+            self._position_phase(step_index, total_steps),
+            max(2, recipe_total_time // max(1, total_steps)),
         )
-        can_batch = self._can_batch(action_type, ingredient)
+        if explicit_duration is not None and action_type != "descriptive":
+            duration = explicit_duration
 
         return ParsedPrepStep(
             action_type=action_type,
@@ -292,32 +445,45 @@ class HeuristicStepParser:
             parse_source="heuristic",
         )
 
-    def _is_descriptive_text(self, step_lower: str) -> bool:
+    @classmethod
+    @functools.lru_cache(maxsize=8192)
+    def _classify(
+        cls, step_lower: str, position_phase: Phase, default_duration: int
+    ) -> Tuple[str, str, bool, Equipment, bool, Phase, int]:
+        """
+        Classify a lowercased step into ParsedPrepStep field values.
+
+        Memoized because recipes repeat steps ("Preheat oven to 400°F.").
+        The result depends only on the text, the phase implied by the step's
+        position, and the fallback duration, so those form the cache key.
+        """
+        # Check if this is descriptive/explanatory text (not actionable)
+        if cls._is_descriptive_text(step_lower):
+            return ("descriptive", "", False, Equipment.HANDS_FREE, True, Phase.FINISHING, 0)
+
+        action_type, action_end = cls._extract_action_type(step_lower)
+        ingredient = cls._extract_ingredient(step_lower, action_end)
+        feature_bits = cls._feature_bits(step_lower)
+        return (
+            action_type,
+            ingredient,
+            cls._can_batch(action_type, ingredient),
+            _EQUIPMENT_BY_BITS[feature_bits & _EQUIPMENT_MASK],
+            bool(feature_bits & _PASSIVE_BIT),
+            cls._detect_phase(feature_bits, position_phase),
+            cls._estimate_duration(step_lower, default_duration),
+        )
+
+    @classmethod
+    def _is_descriptive_text(cls, step_lower: str) -> bool:
         """
         Check if a step is descriptive/explanatory text rather than an action.
 
         Descriptive text explains what happens or provides cooking theory,
         but doesn't give actionable instructions.
         """
-        # Check for known descriptive starter patterns
-        for starter in self.DESCRIPTIVE_STARTERS:
-            if step_lower.startswith(starter):
-                return True
-
-        # Check for sentences that start with "The" and describe outcomes
-        # Pattern: "The X will/provides/acts as..." or "The X is..."
-        if step_lower.startswith("the "):
-            descriptive_verbs = [
-                " will ", " provides ", " provide ", " acts as ",
-                " act as ", " serves as ", " is key", " is the ",
-                " gives ", " brings ", " creates ", " softens ",
-                " dissolves ", " mimics ",
-            ]
-            for verb in descriptive_verbs:
-                if verb in step_lower:
-                    return True
-
-        return False
+        # Known starters, or "The X will/provides/acts as..." / "The X is..."
+        return cls._DESCRIPTIVE_RE.match(step_lower) is not None
 
     def parse_steps(self, steps: List[str], context: Dict) -> List[ParsedPrepStep]:
         """
@@ -332,96 +498,165 @@ class HeuristicStepParser:
         Returns:
             List of ParsedPrepStep objects in the same order as input steps.
         """
+        recipe_total_time = context.get("recipe_total_time", 30)
         total_steps = len(steps)
-        parsed_steps = []
-
-        for i, step in enumerate(steps):
-            step_context = {
-                **context,
-                "step_index": i,
-                "total_steps": total_steps,
-            }
-            parsed_steps.append(self.parse_step(step, step_context))
-
-        return parsed_steps
-
-    def _extract_action_type(self, step_lower: str) -> str:
-        """Extract and normalize the action type from a step."""
-        # Check for compound actions first (e.g., "peel and cube")
-        for action_type, keywords in self.ACTION_KEYWORDS.items():
-            for keyword in keywords:
-                # Match whole word or at word boundaries
-                if keyword in step_lower:
-                    return action_type
-
-        return "other"
-
-    def _extract_ingredient(self, step_lower: str, action_type: str) -> str:
+
+        # Lowercase and scan for time mentions once for the whole recipe
+        joined_lower = _BATCH_SEP.join(steps).lower()
+        step_lowers = joined_lower.split(_BATCH_SEP)
+        if len(step_lowers) == total_steps:
+            durations = self._explicit_durations(joined_lower, step_lowers)
+        else:
+            # A step contained the separator; fall back to per-step work
+            step_lowers = [step.lower() for step in steps]
+            durations = [self._explicit_duration(s) for s in step_lowers]
+
+        parse_step_fast = self._parse_step_fast
+        return [
+            parse_step_fast(
+                step, step_lower, recipe_total_time, total_steps, i, duration
+            )
+            for i, (step, step_lower, duration) in enumerate(
+                zip(steps, step_lowers, durations)
+            )
+        ]
+
+    def parse_recipes(
+        self, recipes: List[Tuple[List[str], Dict]]
+    ) -> List[List[ParsedPrepStep]]:
         """
-        Extract the main ingredient from a step.
+        Parse the steps of several recipes.
 
-        Uses action type to find the ingredient that follows the action verb.
+        Args:
+            recipes: (steps, context) pairs, as passed to parse_steps.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
         """
-        # Get the keywords for this action type
-        keywords = self.ACTION_KEYWORDS.get(action_type, [])
+        return [self.parse_steps(steps, context) for steps, context in recipes]
 
-        for keyword in keywords:
-            if keyword in step_lower:
-                parts = step_lower.split(keyword, 1)
-                if len(parts) > 1:
-                    ingredient_part = parts[1].strip()
-                    # Remove parenthetical content
-                    ingredient_part = re.sub(r'\([^)]*\)', '', ingredient_part)
-
-                    words = ingredient_part.split()
-                    if words:
-                        # Try to find a valid ingredient word
-                        for word in words:
-                            clean_word = word.rstrip(".,;:")
-                            if not clean_word:
-                                continue
-                            if clean_word[0].isdigit():
-                                continue
-                            if clean_word in self.FILTER_WORDS:
-                                continue
-                            if len(clean_word) <= 1:
-                                continue
-                            return clean_word
-        return ""
+    def confidence(self, parsed: ParsedPrepStep) -> float:
+        """
+        Estimate how reliable a heuristic parse is, from 0.0 to 1.0.
 
-    def _detect_equipment(self, step_lower: str) -> Equipment:
-        """Detect which equipment category a step uses."""
-        # Check for oven keywords first (explicit equipment)
-        if any(kw in step_lower for kw in self.OVEN_KEYWORDS):
-            return Equipment.OVEN
+        Descriptive text and CONFIDENT_ACTIONS steps score high; steps with
+        no action keyword score 0.0. Other steps score in between, since the
+        keyword rules can't normalize their ingredients for batching.
+        """
+        if parsed.action_type == "descriptive":
+            return 1.0
+        if parsed.action_type in self.CONFIDENT_ACTIONS:
+            return 0.9
+        if parsed.action_type == "other":
+            return 0.0
+        return 0.5
+
+    @staticmethod
+    def _explicit_duration(step_lower: str) -> Optional[int]:
+        """Return the time stated in a step in minutes, or None."""
+        hours = None
+        for match in _TIME_RE.finditer(step_lower):
+            if match.group(2):
+                return int(match.group(1))
+            if hours is None:
+                hours = int(match.group(1)) * 60
+        return hours
+
+    @staticmethod
+    def _explicit_durations(
+        joined_lower: str, step_lowers: List[str]
+    ) -> List[Optional[int]]:
+        """
+        Return _explicit_duration for every step with one regex pass.
 
-        # Check for stovetop keywords (active cooking) BEFORE hands-free
-        # This prevents "cook lamb" from being classified as PREP_AREA
-        if any(kw in step_lower for kw in self.STOVETOP_KEYWORDS):
-            return Equipment.STOVETOP
+        joined_lower is the steps joined by _BATCH_SEP; matches are mapped
+        back to their step by offset. The separator can't be matched by
+        the pattern, so no match spans two steps.
+        """
+        starts = []
+        offset = 0
+        for step_lower in step_lowers:
+            starts.append(offset)
+            offset += len(step_lower) + len(_BATCH_SEP)
+
+        bisect_right = bisect.bisect_right
+        minutes: List[Optional[int]] = [None] * len(step_lowers)
+        hours: List[Optional[int]] = [None] * len(step_lowers)
+        for match in _TIME_RE.finditer(joined_lower):
+            i = bisect_right(starts, match.start()) - 1
+            if match.group(2):
+                if minutes[i] is None:
+                    minutes[i] = int(match.group(1))
+            elif hours[i] is None:
+                hours[i] = int(match.group(1)) * 60
+
+        return [m if m is not None else h for m, h in zip(minutes, hours)]
+
+    @classmethod
+    def _extract_action_type(cls, step_lower: str) -> Tuple[str, int]:
+        """
+        Extract and normalize the action type from a step.
 
-        # Check hands-free last (passive steps like rest, marinate)
-        if any(kw in step_lower for kw in self.HANDS_FREE_KEYWORDS):
-            return Equipment.HANDS_FREE
+        The first action keyword in the text wins, so the step's leading verb
+        decides ("Serve over sliced apple" -> "serve"). At the same position,
+        compound keywords outrank their substrings ("preheat oven" -> "preheat").
 
-        # Default to prep area (chopping, mixing, etc.)
-        return Equipment.PREP_AREA
+        Returns:
+            The action type and the offset just past the matched keyword,
+            or ("other", -1) if no keyword matched.
+        """
+        match = cls._ACTION_RE.search(step_lower)
+        if match is None:
+            return "other", -1
+        return cls._ACTION_TYPE_BY_KEYWORD[match.group(0)], match.end()
 
-    def _is_passive(self, step_lower: str) -> bool:
-        """Check if a step is passive (no active attention needed)."""
-        return any(kw in step_lower for kw in self.PASSIVE_KEYWORDS)
+    @classmethod
+    def _extract_ingredient(cls, step_lower: str, action_end: int) -> str:
+        """
+        Extract the main ingredient from a step.
 
-    def _detect_phase(self, step_lower: str, step_index: int, total_steps: int) -> Phase:
-        """Detect which cooking phase a step belongs to."""
-        # Check for finishing keywords first
-        if any(kw in step_lower for kw in self.FINISHING_KEYWORDS):
-            return Phase.FINISHING
+        Takes the first valid word after the action keyword, which ends at
+        action_end (-1 if the step had no action keyword).
+        """
+        if action_end < 0:
+            return ""
+
+        # Remove parenthetical content
+        ingredient_part = _PARENTHETICAL_RE.sub("", step_lower[action_end:])
+
+        # Try to find a valid ingredient word
+        filter_words = cls.FILTER_WORDS
+        for match in _INGREDIENT_WORD_RE.finditer(ingredient_part):
+            word = match.group(0)
+            if len(word) > 1 and word not in filter_words:
+                return word
+        return ""
 
-        # Check for cooking keywords
-        if any(kw in step_lower for kw in self.COOKING_KEYWORDS):
-            return Phase.COOKING
+    @classmethod
+    def _feature_bits(cls, step_lower: str) -> int:
+        """
+        Scan a step once per keyword category and return the matched bits.
 
-        # Use position-based heuristic for remaining steps
+        Equipment, passivity, and keyword-driven phase are then read from the
+        bits with table lookups instead of cascades of any() checks.
+        """
+        bits = 0
+        for pattern, bit in cls._FEATURE_PATTERNS:
+            if pattern.search(step_lower):
+                bits |= bit
+        return bits
+
+    @staticmethod
+    def _detect_phase(feature_bits: int, position_phase: Phase) -> Phase:
+        """Detect which cooking phase a step belongs to."""
+        # Finishing keywords take priority over cooking keywords; steps with
+        # neither fall back to the phase implied by their position
+        phase = _PHASE_BY_BITS[(feature_bits >> _PHASE_SHIFT) & 0b11]
+        return position_phase if phase is None else phase
+
+    @staticmethod
+    def _position_phase(step_index: int, total_steps: int) -> Phase:
+        """Phase implied by a step's position within its recipe."""
         if total_steps > 0:
             position_ratio = step_index / total_steps
             if position_ratio < 0.4:
@@ -433,79 +668,23 @@ class HeuristicStepParser:
 
         return Phase.PREP
 
-    def _estimate_duration(self, step_lower: str, recipe_total_time: int, total_steps: int) -> int:
-        """Estimate the duration of a step in minutes."""
-        # Look for explicit time mentions
-        time_match = re.search(r"(\d+)\s*(?:min|minute)", step_lower)
-        if time_match:
-            return int(time_match.group(1))
-
-        # Check for hour mentions
-        hour_match = re.search(r"(\d+)\s*(?:hour)", step_lower)
-        if hour_match:
-            return int(hour_match.group(1)) * 60
-
-        # Time estimates by action type
-        # Long passive cooking
-        if any(kw in step_lower for kw in ["bake", "roast"]):
-            return 30
-        if "slow" in step_lower or "slowly" in step_lower:
-            return 15
-        if "braise" in step_lower:
-            return 20
-
-        # Medium-length cooking
-        if "simmer" in step_lower:
-            return 15
-        if "cook" in step_lower:
-            return 10
-        if "render" in step_lower:
-            return 10
-
-        # Quick cooking
-        if any(kw in step_lower for kw in ["sear", "brown", "char", "fry"]):
-            return 5
-        if "sauté" in step_lower or "saute" in step_lower:
-            return 5
-
-        # Prep work
-        if any(kw in step_lower for kw in ["chop", "dice", "mince", "slice", "cube"]):
-            return 3
-        if any(kw in step_lower for kw in ["wash", "rinse"]):
-            return 2
-        if any(kw in step_lower for kw in ["peel", "core", "trim"]):
-            return 2
-        if any(kw in step_lower for kw in ["mix", "whisk", "stir", "toss", "combine"]):
-            return 2
-        if any(kw in step_lower for kw in ["grate", "zest", "julienne"]):
-            return 2
-        if any(kw in step_lower for kw in ["season", "salt"]):
-            return 1
-
-        # Quick actions (30 sec - 1 min, round up to 1)
-        # These are placement, transfer, and simple arrangement actions
-        cooking_keywords = ["cook", "sear", "fry", "bake", "roast", "simmer", "brown"]
-        if any(kw in step_lower for kw in self.QUICK_ACTION_KEYWORDS):
-            # Only count as quick if no cooking is involved
-            if not any(cook_kw in step_lower for cook_kw in cooking_keywords):
-                return 1
-
-        # Waiting/resting
-        if any(kw in step_lower for kw in ["rest", "let sit", "marinate"]):
-            return 10
-
-        # Preheating
-        if "preheat" in step_lower:
-            return 5
-
-        # Serving/plating
-        if any(kw in step_lower for kw in ["serve", "plate", "garnish"]):
-            return 2
+    @classmethod
+    def _estimate_duration(cls, step_lower: str, default_duration: int) -> int:
+        """
+        Estimate the duration of a step in minutes from its keywords.
 
-        # Default: divide recipe time by steps
-        return max(2, recipe_total_time // max(1, total_steps))
+        Times stated in the step are handled by the caller. Walks the
+        DURATION_RULES keywords in order and returns the minutes of the first
+        one found. default_duration (recipe time divided by step count) is
+        used when no keyword applies.
+        """
+        for keyword, minutes in cls._DURATION_BY_KEYWORD:
+            if keyword in step_lower:
+                return minutes
+        return default_duration
 
-    def _can_batch(self, action_type: str, ingredient: str) -> bool:
+    @classmethod
+    def _can_batch(cls, action_type: str, ingredient: str) -> bool:
         """Check if a step can be batched with similar steps."""
         # Actions that can typically be batched
         batchable_actions = {
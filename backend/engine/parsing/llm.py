@@ -11,20 +11,40 @@ superior accuracy for:
 Falls back to HeuristicStepParser on errors.
 """
 
+import dataclasses
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from backend.clients.openai_client import OpenAIClient, OpenAIClientError
-from backend.engine.parsing.cache import get_step_cache
+from backend.config import settings
+from backend.engine.parsing.cache import get_step_cache, normalize_step_text
 from backend.engine.parsing.heuristic import HeuristicStepParser
 from backend.engine.parsing.models import Equipment, ParsedPrepStep, Phase
 
 logger = logging.getLogger(__name__)
 
 
-# System prompt for the LLM
-SYSTEM_PROMPT = """You are a culinary assistant that analyzes recipe preparation steps.
+# Version of the prompts below, part of every step cache key. Bump it when
+# the prompts or the parsed fields change so old cache entries stop matching.
+SYSTEM_PROMPT_VERSION = "v2"
+
+# Fields to extract for every step, part of the system prompt
+_FIELD_INSTRUCTIONS = """Parse each step and extract:
+- action_type: Primary action NORMALIZED (chop, wash, mix, roast, simmer, etc.)
+  - For descriptive/explanatory text that isn't actionable, use "descriptive"
+- ingredient: Main ingredient NORMALIZED (remove adjectives like "fresh", "tart"), or null if none
+- duration_minutes: Estimated time for this step (use 0 for descriptive text)
+- equipment: "oven" | "stovetop" | "prep_area" | "hands_free"
+- is_passive: true if no active attention needed (simmer, rest, bake)
+- can_batch: true if combinable with similar steps across recipes
+- phase: "prep" | "cooking" | "finishing\""""
+
+# System prompt for the LLM. Everything that doesn't vary per request lives
+# here, as the first message, so OpenAI's prompt caching can reuse it as a
+# prefix once it is long enough (1024 tokens).
+SYSTEM_PROMPT = f"""You are a culinary assistant that analyzes recipe preparation steps.
 Extract structured information to help optimize cooking schedules.
 
 IMPORTANT: Normalize action types and ingredients to canonical forms:
@@ -53,9 +73,36 @@ Phase Categories:
 - "cooking": any heat application (stovetop, oven)
 - "finishing": serving, plating, garnishing, final additions
 
+{_FIELD_INSTRUCTIONS}
+
 Respond with a JSON object containing a "parsed_steps" array."""
 
 
+# A recipe with uncached steps awaiting the LLM:
+# (position in the input, uncached step indices, uncached steps, context)
+_PendingRecipe = Tuple[int, List[int], List[str], Dict]
+
+# Upper bound on steps sent in one request when parsing several recipes.
+# Whole recipes are packed into a request up to this size; a recipe larger
+# than this is sent on its own.
+MAX_STEPS_PER_REQUEST = 60
+
+
+# Equipment and phase values in LLM responses, mapped to their enums
+_EQUIPMENT_MAP: Dict[str, Equipment] = {
+    "oven": Equipment.OVEN,
+    "stovetop": Equipment.STOVETOP,
+    "prep_area": Equipment.PREP_AREA,
+    "hands_free": Equipment.HANDS_FREE,
+}
+
+_PHASE_MAP: Dict[str, Phase] = {
+    "prep": Phase.PREP,
+    "cooking": Phase.COOKING,
+    "finishing": Phase.FINISHING,
+}
+
+
 def _build_user_prompt(steps: List[str], context: Dict) -> str:
     """Build the user prompt for the LLM."""
     recipe_name = context.get("recipe_name", "Unknown Recipe")
@@ -70,16 +117,6 @@ Total prep time: {total_time} minutes
 IMPORTANT: You MUST return exactly {num_steps} parsed steps - one for each input step below.
 Do NOT skip, combine, or merge steps. Each input step should have exactly one corresponding output.
 
-Parse each step and extract:
-- action_type: Primary action NORMALIZED (chop, wash, mix, roast, simmer, etc.)
-  - For descriptive/explanatory text that isn't actionable, use "descriptive"
-- ingredient: Main ingredient NORMALIZED (remove adjectives like "fresh", "tart"), or null if none
-- duration_minutes: Estimated time for this step (use 0 for descriptive text)
-- equipment: "oven" | "stovetop" | "prep_area" | "hands_free"
-- is_passive: true if no active attention needed (simmer, rest, bake)
-- can_batch: true if combinable with similar steps across recipes
-- phase: "prep" | "cooking" | "finishing"
-
 Steps ({num_steps} total):
 {steps_text}
 
@@ -91,6 +128,37 @@ Return JSON with exactly {num_steps} items in parsed_steps:
 }}"""
 
 
+def _build_multi_recipe_user_prompt(recipes: List[Tuple[List[str], Dict]]) -> str:
+    """Build one user prompt covering the steps of several recipes."""
+    num_steps = sum(len(steps) for steps, _ in recipes)
+
+    recipe_sections = []
+    for recipe_index, (steps, context) in enumerate(recipes):
+        recipe_name = context.get("recipe_name", "Unknown Recipe")
+        total_time = context.get("recipe_total_time", 30)
+        steps_text = "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
+        recipe_sections.append(
+            f"Recipe {recipe_index}: {recipe_name} "
+            f"(total prep time: {total_time} minutes, {len(steps)} steps)\n{steps_text}"
+        )
+    recipes_text = "\n\n".join(recipe_sections)
+
+    return f"""Recipes: {len(recipes)}
+
+IMPORTANT: You MUST return exactly {num_steps} parsed steps - one for each input step below.
+Do NOT skip, combine, or merge steps. Each input step should have exactly one corresponding output.
+Steps are numbered from 1 within each recipe; step_index counts from 0 within each recipe.
+
+{recipes_text}
+
+Return JSON with exactly {num_steps} items in parsed_steps:
+{{
+  "parsed_steps": [
+    {{"recipe_index": 0, "step_index": 0, "action_type": "...", "ingredient": "...", "duration_minutes": N, "equipment": "...", "is_passive": bool, "can_batch": bool, "phase": "..."}}
+  ]
+}}"""
+
+
 class LLMStepParser:
     """
     LLM-powered step parser with caching and heuristic fallback.
@@ -128,106 +196,347 @@ class LLMStepParser:
         Parse multiple recipe steps into structured data.
 
         Checks cache first, then calls LLM for uncached steps.
-        Falls back to heuristics on any error.
+        The cache is keyed on step text, so steps already parsed for
+        another recipe are reused. Falls back to heuristics on any error.
 
         Args:
             steps: List of raw step texts.
             context: Additional context with:
                 - recipe_name: Name of the recipe
                 - recipe_total_time: Total prep time in minutes
-                - recipe_id: Unique identifier for caching
 
         Returns:
             List of ParsedPrepStep objects in the same order as input steps.
         """
-        recipe_id = context.get("recipe_id", context.get("recipe_name", "unknown"))
-        total_steps = len(steps)
+        return self.parse_recipes([(steps, context)])[0]
+
+    def parse_recipes(
+        self, recipes: List[Tuple[List[str], Dict]]
+    ) -> List[List[ParsedPrepStep]]:
+        """
+        Parse the steps of several recipes, sharing LLM calls between them.
 
-        # Check cache for all steps
-        cached_results: Dict[int, ParsedPrepStep] = {}
-        uncached_indices: List[int] = []
-        uncached_steps: List[str] = []
+        Uncached steps from all recipes go out in as few requests as
+        possible (up to MAX_STEPS_PER_REQUEST steps each), instead of one
+        request per recipe. Requests that are needed run concurrently.
 
-        for i, step in enumerate(steps):
-            cached = self._cache.get(recipe_id, step)
-            if cached:
-                cached_results[i] = cached
+        Args:
+            recipes: (steps, context) pairs, with context as for parse_steps.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
+        """
+        return self._parse_recipes_with(recipes, self._run_requests)
+
+    def parse_recipes_batch(
+        self, recipes: List[Tuple[List[str], Dict]]
+    ) -> List[List[ParsedPrepStep]]:
+        """
+        Parse the steps of several recipes through the OpenAI Batch API.
+
+        Same requests and caching as parse_recipes, but submitted as one
+        Batch API job at half the token price. Blocks until the batch
+        finishes, which can take hours, so use it only to warm the cache
+        ahead of time (see PrepOptimizer.precompute_meal_plans).
+
+        Args:
+            recipes: (steps, context) pairs, with context as for parse_steps.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
+        """
+        return self._parse_recipes_with(recipes, self._run_requests_as_batch)
+
+    def _parse_recipes_with(
+        self,
+        recipes: List[Tuple[List[str], Dict]],
+        run_requests: Callable[
+            [List[List[_PendingRecipe]]], List[Optional[List[List[ParsedPrepStep]]]]
+        ],
+    ) -> List[List[ParsedPrepStep]]:
+        """
+        Parse recipes from cache, sending the uncached steps via run_requests.
+
+        run_requests gets the uncached steps packed into requests and
+        returns parsed steps per recipe for each request, or None for a
+        request that failed.
+        """
+        results: List[List[Optional[ParsedPrepStep]]] = []
+        pending: List[_PendingRecipe] = []
+        threshold = settings.step_parsing_heuristic_confidence
+        # Each distinct uncached step is sent once. The first occurrence's
+        # (position, index) by normalized text, and every later occurrence
+        # as (position, index, first position, first index).
+        first_occurrences: Dict[str, Tuple[int, int]] = {}
+        duplicates: List[Tuple[int, int, int, int]] = []
+
+        for position, (steps, context) in enumerate(recipes):
+            parsed = self._cache.get_many(steps, SYSTEM_PROMPT_VERSION)
+            uncached_indices = []
+            for i, cached in enumerate(parsed):
+                if cached is None:
+                    uncached_indices.append(i)
+                elif cached.raw_step != steps[i]:
+                    # Cached from the same step in another recipe
+                    parsed[i] = dataclasses.replace(cached, raw_step=steps[i])
+            results.append(parsed)
+
+            if uncached_indices:
+                # Keep heuristic results the keyword rules are sure of; only
+                # the rest are worth an LLM call. They aren't cached since
+                # reparsing them is cheap.
+                heuristic = self._fallback.parse_steps(steps, context)
+                confidence = self._fallback.confidence
+                still_uncached = []
+                for i in uncached_indices:
+                    if confidence(heuristic[i]) >= threshold:
+                        parsed[i] = heuristic[i]
+                        continue
+                    first = first_occurrences.setdefault(
+                        normalize_step_text(steps[i]), (position, i)
+                    )
+                    if first == (position, i):
+                        still_uncached.append(i)
+                    else:
+                        duplicates.append((position, i, *first))
+                uncached_indices = still_uncached
+
+            if uncached_indices:
+                uncached_steps = [steps[i] for i in uncached_indices]
+                pending.append((position, uncached_indices, uncached_steps, context))
             else:
-                uncached_indices.append(i)
-                uncached_steps.append(step)
+                logger.debug(f"All {len(steps)} steps found in cache")
+
+        # Pack whole recipes into requests of up to MAX_STEPS_PER_REQUEST steps
+        requests: List[List[_PendingRecipe]] = []
+        request_size = 0
+        for item in pending:
+            if not requests or request_size + len(item[2]) > MAX_STEPS_PER_REQUEST:
+                requests.append([])
+                request_size = 0
+            requests[-1].append(item)
+            request_size += len(item[2])
+
+        if not requests:
+            return results
+
+        outcomes = run_requests(requests)
+
+        for request, llm_results in zip(requests, outcomes):
+            for (position, uncached_indices, _, context), recipe_results in zip(
+                request, llm_results or [None] * len(request)
+            ):
+                steps = recipes[position][0]
+                if recipe_results is None:
+                    # The request failed; parse the whole recipe heuristically
+                    results[position] = self._parse_with_fallback(steps, context)
+                    continue
+
+                for idx, parsed in zip(uncached_indices, recipe_results):
+                    results[position][idx] = parsed
+                    # Cache the new result
+                    self._cache.set(steps[idx], SYSTEM_PROMPT_VERSION, parsed)
+
+        # Fan results out to the repeats of each step that was sent
+        for position, idx, first_position, first_idx in duplicates:
+            parsed = results[first_position][first_idx]
+            step = recipes[position][0][idx]
+            if parsed.raw_step != step:
+                parsed = dataclasses.replace(parsed, raw_step=step)
+            results[position][idx] = parsed
 
-        # If all steps are cached, return them
-        if not uncached_steps:
-            logger.debug(f"All {len(steps)} steps found in cache")
-            return [cached_results[i] for i in range(len(steps))]
+        return results
+
+    def _run_requests(
+        self, requests: List[List[_PendingRecipe]]
+    ) -> List[Optional[List[List[ParsedPrepStep]]]]:
+        """Send requests as chat completions, concurrently when there are several."""
+        max_workers = min(len(requests), settings.openai_max_concurrency)
+        if max_workers <= 1:
+            return [self._parse_request(request) for request in requests]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._parse_request, requests))
+
+    def _run_requests_as_batch(
+        self, requests: List[List[_PendingRecipe]]
+    ) -> List[Optional[List[List[ParsedPrepStep]]]]:
+        """Send requests as one Batch API job and wait for the results."""
+        user_prompts = {
+            str(i): self._request_prompt(request) for i, request in enumerate(requests)
+        }
 
-        # Call LLM for uncached steps
         try:
-            llm_results = self._parse_with_llm(uncached_steps, context)
+            responses = self._client.parse_json_batch(SYSTEM_PROMPT, user_prompts)
+        except Exception as e:
+            logger.warning(f"LLM batch parsing failed, falling back to heuristics: {e}")
+            return [None] * len(requests)
+
+        outcomes: List[Optional[List[List[ParsedPrepStep]]]] = []
+        for i, request in enumerate(requests):
+            response = responses.get(str(i))
+            if response is None:
+                logger.warning(f"No batch result for request {i}, falling back to heuristics")
+                outcomes.append(None)
+                continue
+            try:
+                outcomes.append(
+                    self._convert_request_response(request, response.get("parsed_steps", []))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to convert batch result for request {i}: {e}")
+                outcomes.append(None)
 
-            # Merge cached and LLM results
-            for idx, parsed in zip(uncached_indices, llm_results):
-                cached_results[idx] = parsed
-                # Cache the new result
-                self._cache.set(recipe_id, steps[idx], parsed)
+        return outcomes
+
+    def _parse_request(
+        self, request: List[_PendingRecipe]
+    ) -> Optional[List[List[ParsedPrepStep]]]:
+        """
+        Send one LLM request for the uncached steps of one or more recipes.
 
-            # Return in original order
-            return [cached_results[i] for i in range(len(steps))]
+        Unless streaming is disabled in settings, the response is streamed
+        and parsed steps are converted as they arrive rather than after the
+        whole reply has been received.
 
+        Returns:
+            Parsed steps for each recipe in the request, or None if the
+            request failed and the caller should fall back to heuristics.
+        """
+        try:
+            user_prompt = self._request_prompt(request)
+            if settings.openai_stream_responses:
+                parsed_steps = self._client.stream_json_items(
+                    system_prompt=SYSTEM_PROMPT,
+                    user_prompt=user_prompt,
+                    key="parsed_steps",
+                )
+            else:
+                response = self._client.parse_json(
+                    system_prompt=SYSTEM_PROMPT,
+                    user_prompt=user_prompt,
+                )
+                parsed_steps = response.get("parsed_steps", [])
+            return self._convert_request_response(request, parsed_steps)
         except Exception as e:
             logger.warning(f"LLM parsing failed, falling back to heuristics: {e}")
-            return self._parse_with_fallback(steps, context)
+            return None
+
+    def _request_prompt(self, request: List[_PendingRecipe]) -> str:
+        """Build the user prompt for a request of one or more recipes."""
+        if len(request) == 1:
+            _, _, steps, context = request[0]
+            return _build_user_prompt(steps, context)
+        return _build_multi_recipe_user_prompt(
+            [(steps, context) for _, _, steps, context in request]
+        )
+
+    def _convert_request_response(
+        self, request: List[_PendingRecipe], parsed_steps: Iterable[Dict[str, Any]]
+    ) -> List[List[ParsedPrepStep]]:
+        """Convert the LLM's parsed steps for a request into parsed steps per recipe."""
+        if len(request) == 1:
+            _, _, steps, context = request[0]
+            return [self._convert_recipe_response(parsed_steps, steps, context)]
+        return self._convert_multi_recipe_response(
+            parsed_steps, [(steps, context) for _, _, steps, context in request]
+        )
 
-    def _parse_with_llm(self, steps: List[str], context: Dict) -> List[ParsedPrepStep]:
+    def _convert_recipe_response(
+        self, parsed_steps: Iterable[Dict[str, Any]], steps: List[str], context: Dict
+    ) -> List[ParsedPrepStep]:
         """
-        Parse steps using the LLM.
+        Convert the LLM's parsed steps for a single recipe.
 
         Args:
-            steps: List of uncached step texts.
-            context: Recipe context for the prompt.
+            parsed_steps: Parsed step data from the LLM response, converted
+                as it is iterated.
+            steps: List of uncached step texts sent in the prompt.
+            context: Recipe context.
 
         Returns:
             List of ParsedPrepStep objects.
-
-        Raises:
-            OpenAIClientError: If the API call fails.
-            ValueError: If the response format is invalid.
         """
-        user_prompt = _build_user_prompt(steps, context)
         total_steps = len(steps)
-
-        response = self._client.parse_json(
-            system_prompt=SYSTEM_PROMPT,
-            user_prompt=user_prompt,
-        )
-
-        parsed_steps = response.get("parsed_steps", [])
-
-        # Handle step count mismatch gracefully
-        if len(parsed_steps) != len(steps):
-            logger.warning(
-                f"LLM returned {len(parsed_steps)} steps, expected {len(steps)}. "
-                "Using step_index to match where possible, falling back for others."
-            )
-            return self._match_llm_results_to_steps(parsed_steps, steps, context)
-
+        # Raw step data is kept in case the counts don't match at the end
+        received: List[Dict[str, Any]] = []
         results = []
+        # Shared by every fallback below; parse_step only reads its context
+        fallback_context = {**context, "total_steps": total_steps}
+
+        # Convert by position as steps arrive
         for i, step_data in enumerate(parsed_steps):
+            received.append(step_data)
+            if i >= total_steps:
+                continue
             try:
                 parsed = self._convert_llm_response(step_data, steps[i])
                 results.append(parsed)
             except Exception as e:
                 logger.warning(f"Failed to convert LLM response for step {i}: {e}")
                 # Use fallback for this step
-                fallback_context = {
-                    **context,
-                    "step_index": i,
-                    "total_steps": total_steps,
-                }
+                fallback_context["step_index"] = i
                 results.append(self._fallback.parse_step(steps[i], fallback_context))
 
+        # Handle step count mismatch gracefully
+        if len(received) != total_steps:
+            logger.warning(
+                f"LLM returned {len(received)} steps, expected {total_steps}. "
+                "Using step_index to match where possible, falling back for others."
+            )
+            return self._match_llm_results_to_steps(received, steps, context)
+
         return results
 
+    def _convert_multi_recipe_response(
+        self,
+        parsed_steps: Iterable[Dict[str, Any]],
+        recipes: List[Tuple[List[str], Dict]],
+    ) -> List[List[ParsedPrepStep]]:
+        """
+        Convert the LLM's parsed steps for several recipes.
+
+        Results are matched back by recipe_index and step_index. Steps the
+        LLM skipped or returned malformed are parsed heuristically.
+
+        Args:
+            parsed_steps: Parsed step data from the LLM response, converted
+                as it is iterated.
+            recipes: (uncached steps, context) pairs sent in the prompt.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
+        """
+        results: List[Dict[int, ParsedPrepStep]] = [{} for _ in recipes]
+        for step_data in parsed_steps:
+            recipe_index = step_data.get("recipe_index")
+            idx = step_data.get("step_index")
+            if not isinstance(recipe_index, int) or not 0 <= recipe_index < len(recipes):
+                continue
+            steps = recipes[recipe_index][0]
+            if not isinstance(idx, int) or not 0 <= idx < len(steps):
+                continue
+            try:
+                results[recipe_index][idx] = self._convert_llm_response(step_data, steps[idx])
+            except Exception as e:
+                logger.warning(
+                    f"Failed to convert LLM response for recipe {recipe_index} step {idx}: {e}"
+                )
+
+        # Fill in any missing steps with heuristic fallback
+        parsed_recipes = []
+        for (steps, context), recipe_results in zip(recipes, results):
+            total_steps = len(steps)
+            # Shared by the recipe's fallbacks; parse_step only reads its context
+            fallback_context = {**context, "total_steps": total_steps}
+            for i in range(total_steps):
+                if i not in recipe_results:
+                    fallback_context["step_index"] = i
+                    recipe_results[i] = self._fallback.parse_step(steps[i], fallback_context)
+            parsed_recipes.append([recipe_results[i] for i in range(total_steps)])
+
+        return parsed_recipes
+
     def _match_llm_results_to_steps(
         self,
         parsed_steps: List[Dict[str, Any]],
@@ -261,14 +570,12 @@ class LLMStepParser:
                 except Exception as e:
                     logger.warning(f"Failed to convert LLM response for step {idx}: {e}")
 
-        # Fill in any missing steps with heuristic fallback
+        # Fill in any missing steps with heuristic fallback, sharing one
+        # context dict since parse_step only reads it
+        fallback_context = {**context, "total_steps": total_steps}
         for i in range(total_steps):
             if i not in results:
-                fallback_context = {
-                    **context,
-                    "step_index": i,
-                    "total_steps": total_steps,
-                }
+                fallback_context["step_index"] = i
                 results[i] = self._fallback.parse_step(steps[i], fallback_context)
 
         return [results[i] for i in range(total_steps)]
@@ -284,24 +591,12 @@ class LLMStepParser:
         Returns:
             ParsedPrepStep instance.
         """
-        # Map equipment string to enum
-        equipment_str = data.get("equipment", "prep_area").lower()
-        equipment_map = {
-            "oven": Equipment.OVEN,
-            "stovetop": Equipment.STOVETOP,
-            "prep_area": Equipment.PREP_AREA,
-            "hands_free": Equipment.HANDS_FREE,
-        }
-        equipment = equipment_map.get(equipment_str, Equipment.PREP_AREA)
-
-        # Map phase string to enum
-        phase_str = data.get("phase", "prep").lower()
-        phase_map = {
-            "prep": Phase.PREP,
-            "cooking": Phase.COOKING,
-            "finishing": Phase.FINISHING,
-        }
-        phase = phase_map.get(phase_str, Phase.PREP)
+        # Map equipment and phase strings to enums; the LLM may send null
+        equipment_str = (data.get("equipment") or "prep_area").lower()
+        equipment = _EQUIPMENT_MAP.get(equipment_str, Equipment.PREP_AREA)
+
+        phase_str = (data.get("phase") or "prep").lower()
+        phase = _PHASE_MAP.get(phase_str, Phase.PREP)
 
         return ParsedPrepStep(
             action_type=data.get("action_type", "other"),
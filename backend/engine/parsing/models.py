@@ -27,7 +27,7 @@ class Phase(str, Enum):
     FINISHING = "finishing"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPrepStep:
     """
     Structured representation of a recipe step for optimization.
@@ -4,7 +4,7 @@ Protocol definition for step parsers.
 Defines the interface that all step parsers must implement.
 """
 
-from typing import Dict, List, Protocol
+from typing import Dict, List, Protocol, Tuple
 
 from backend.engine.parsing.models import ParsedPrepStep
 
@@ -51,3 +51,20 @@ class StepParser(Protocol):
             List of ParsedPrepStep objects in the same order as input steps.
         """
         ...
+
+    def parse_recipes(
+        self, recipes: List[Tuple[List[str], Dict]]
+    ) -> List[List[ParsedPrepStep]]:
+        """
+        Parse the steps of several recipes.
+
+        Lets the LLM parser cover many recipes with one request instead of
+        one request per recipe.
+
+        Args:
+            recipes: (steps, context) pairs, as passed to parse_steps.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
+        """
+        ...
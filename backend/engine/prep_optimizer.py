@@ -3,9 +3,9 @@ Prep sequence optimizer.
 Batches similar cooking steps across meals to minimize total prep time.
 Now supports LLM-powered step parsing for semantic normalization.
 """
+from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
 
 from backend.models.schemas import (
     MealPlan, PrepStep, OptimizedPrepTimeline,
@@ -16,6 +16,50 @@ from backend.engine.parsing import (
 )
 
 
+# Common adverbs that should be skipped when extracting action verbs
+COMMON_ADVERBS = frozenset({
+    "finely", "roughly", "thinly", "thickly", "quickly", "slowly",
+    "gently", "vigorously", "carefully", "lightly", "heavily",
+    "generously", "thoroughly", "immediately", "briefly", "well",
+})
+
+# Parsing enums mapped to their schema counterparts
+_EQUIPMENT_TYPES: Dict[Equipment, EquipmentType] = {
+    Equipment.OVEN: EquipmentType.OVEN,
+    Equipment.STOVETOP: EquipmentType.STOVETOP,
+    Equipment.PREP_AREA: EquipmentType.PREP_AREA,
+    Equipment.HANDS_FREE: EquipmentType.HANDS_FREE,
+}
+
+_COOKING_PHASES: Dict[Phase, CookingPhase] = {
+    Phase.PREP: CookingPhase.PREP,
+    Phase.COOKING: CookingPhase.COOKING,
+    Phase.FINISHING: CookingPhase.FINISHING,
+}
+
+# Strips punctuation from action text before splitting it into words
+_PUNCTUATION_TABLE = str.maketrans("", "", ".,;:")
+
+
+@dataclass
+class _BatchGroup:
+    """Steps sharing a batch key, with totals kept up to date as steps are added."""
+
+    steps: List[PrepStep] = field(default_factory=list)
+    max_duration: int = 0
+    total_duration: int = 0
+    # Source recipe names in first-seen order (dict keys as an ordered set)
+    sources: Dict[str, None] = field(default_factory=dict)
+
+    def add(self, step: PrepStep) -> None:
+        self.steps.append(step)
+        if step.duration_minutes > self.max_duration:
+            self.max_duration = step.duration_minutes
+        self.total_duration += step.duration_minutes
+        for recipe_name in step.source_recipes:
+            self.sources[recipe_name] = None
+
+
 class PrepOptimizer:
     """
     Optimize meal prep sequences by batching similar tasks.
@@ -34,11 +78,15 @@ class PrepOptimizer:
             parser: Optional step parser. If not provided, creates one based on config.
         """
         self._parser = parser or create_step_parser()
+        # Parsed steps per recipe, so a recipe repeated across prep days is
+        # parsed once for the life of this optimizer
+        self._recipe_cache: Dict[Tuple, List[ParsedPrepStep]] = {}
 
     def _create_prep_steps_from_recipe(
         self,
         recipe: Recipe,
-        step_offset: int = 0
+        step_offset: int = 0,
+        parsed_steps: Optional[List[ParsedPrepStep]] = None,
     ) -> List[PrepStep]:
         """
         Convert recipe steps to PrepStep objects using the step parser.
@@ -46,18 +94,13 @@ class PrepOptimizer:
         Args:
             recipe: The recipe to parse.
             step_offset: Offset for step numbering (for multi-recipe timelines).
+            parsed_steps: Already-parsed steps for the recipe. Parsed here if omitted.
 
         Returns:
             List of PrepStep objects with parsed metadata.
         """
-        context = {
-            "recipe_id": recipe.id,
-            "recipe_name": recipe.name,
-            "recipe_total_time": recipe.prep_time_minutes,
-        }
-
-        # Parse all steps at once for better LLM context
-        parsed_steps = self._parser.parse_steps(recipe.prep_steps, context)
+        if parsed_steps is None:
+            parsed_steps = self._parse_recipe(recipe)
 
         prep_steps = []
         step_count = 0
@@ -93,24 +136,89 @@ class PrepOptimizer:
 
         return prep_steps
 
+    def _recipe_context(self, recipe: Recipe) -> Dict:
+        """Build the parser context for a recipe."""
+        return {
+            "recipe_id": recipe.id,
+            "recipe_name": recipe.name,
+            "recipe_total_time": recipe.prep_time_minutes,
+        }
+
+    def _recipe_cache_key(self, recipe: Recipe) -> Tuple:
+        """Key a recipe on everything the parser sees, so an edited recipe is reparsed."""
+        return (recipe.id, recipe.name, recipe.prep_time_minutes, tuple(recipe.prep_steps))
+
+    def _parse_recipe(self, recipe: Recipe) -> List[ParsedPrepStep]:
+        """Parse all steps of a recipe at once for better LLM context."""
+        return self._parse_recipes([recipe])[0]
+
+    def _parse_recipes(self, recipes: List[Recipe]) -> List[List[ParsedPrepStep]]:
+        """
+        Parse several recipes with one parser call.
+
+        The LLM parser sends the steps of all the recipes in one request
+        rather than one round trip per recipe. Recipes parsed earlier by
+        this optimizer are served from its recipe cache and not sent again.
+
+        Returns:
+            Parsed steps for each recipe, in the order given.
+        """
+        keys = [self._recipe_cache_key(recipe) for recipe in recipes]
+
+        uncached: Dict[Tuple, Recipe] = {}
+        for key, recipe in zip(keys, recipes):
+            if key not in self._recipe_cache:
+                uncached.setdefault(key, recipe)
+
+        if uncached:
+            parsed = self._parser.parse_recipes(
+                [(recipe.prep_steps, self._recipe_context(recipe)) for recipe in uncached.values()]
+            )
+            self._recipe_cache.update(zip(uncached, parsed))
+
+        return [self._recipe_cache[key] for key in keys]
+
+    @property
+    def supports_batch(self) -> bool:
+        """Whether the parser can precompute through the Batch API."""
+        return getattr(self._parser, "parse_recipes_batch", None) is not None
+
+    def precompute_meal_plans(self, meal_plans: List[MealPlan]) -> int:
+        """
+        Parse the recipes of upcoming meal plans ahead of time.
+
+        Uses the parser's Batch API path when it has one (LLM parsing), so
+        the step cache is warm and timelines are served without waiting on
+        the LLM. Blocks until the batch finishes; meant for background jobs.
+
+        Args:
+            meal_plans: Meal plans whose recipes should be parsed.
+
+        Returns:
+            Number of distinct recipes submitted, or 0 if the parser has no
+            Batch API support.
+        """
+        if not self.supports_batch:
+            return 0
+
+        recipes = {
+            meal.recipe.id: meal.recipe
+            for meal_plan in meal_plans
+            for meal in meal_plan.meals
+        }
+        if recipes:
+            self._parser.parse_recipes_batch(
+                [(recipe.prep_steps, self._recipe_context(recipe)) for recipe in recipes.values()]
+            )
+        return len(recipes)
+
     def _map_equipment(self, equipment: Equipment) -> EquipmentType:
         """Map parsing Equipment enum to schema EquipmentType."""
-        mapping = {
-            Equipment.OVEN: EquipmentType.OVEN,
-            Equipment.STOVETOP: EquipmentType.STOVETOP,
-            Equipment.PREP_AREA: EquipmentType.PREP_AREA,
-            Equipment.HANDS_FREE: EquipmentType.HANDS_FREE,
-        }
-        return mapping.get(equipment, EquipmentType.PREP_AREA)
+        return _EQUIPMENT_TYPES.get(equipment, EquipmentType.PREP_AREA)
 
     def _map_phase(self, phase: Phase) -> CookingPhase:
         """Map parsing Phase enum to schema CookingPhase."""
-        mapping = {
-            Phase.PREP: CookingPhase.PREP,
-            Phase.COOKING: CookingPhase.COOKING,
-            Phase.FINISHING: CookingPhase.FINISHING,
-        }
-        return mapping.get(phase, CookingPhase.PREP)
+        return _COOKING_PHASES.get(phase, CookingPhase.PREP)
 
     def optimize_meal_prep(self, meal_plan: MealPlan, prep_date: date) -> OptimizedPrepTimeline:
         """
@@ -136,39 +244,38 @@ class PrepOptimizer:
             )
 
         # Collect all steps from all recipes
+        recipes = [meal.recipe for meal in meals_for_date]
         all_steps: List[PrepStep] = []
-        for meal in meals_for_date:
-            recipe_steps = self._create_prep_steps_from_recipe(meal.recipe, len(all_steps))
+        for recipe, parsed_steps in zip(recipes, self._parse_recipes(recipes)):
+            recipe_steps = self._create_prep_steps_from_recipe(
+                recipe, len(all_steps), parsed_steps
+            )
             all_steps.extend(recipe_steps)
 
-        # Group steps by batch key
-        batch_groups: Dict[str, List[PrepStep]] = defaultdict(list)
+        # Group steps by batch key in one pass, keeping each group's longest
+        # and total duration and its source recipes up to date as we go
+        batch_groups: Dict[str, _BatchGroup] = {}
         non_batch_steps: List[PrepStep] = []
 
         for step in all_steps:
             if step.can_batch and step.batch_key:
-                batch_groups[step.batch_key].append(step)
+                group = batch_groups.get(step.batch_key)
+                if group is None:
+                    group = batch_groups[step.batch_key] = _BatchGroup()
+                group.add(step)
             else:
                 non_batch_steps.append(step)
 
         # Optimize batched steps
         optimized_steps: List[PrepStep] = []
         time_saved = 0
+        total_time = 0
 
-        for batch_key, batch_steps in batch_groups.items():
+        for batch_key, group in batch_groups.items():
+            batch_steps = group.steps
             if len(batch_steps) > 1:
                 combined_action = self._combine_batch_steps(batch_steps)
-                combined_duration = max(s.duration_minutes for s in batch_steps)
-
-                original_time = sum(s.duration_minutes for s in batch_steps)
-                time_saved += (original_time - combined_duration)
-
-                # Combine source recipes (preserve order, remove duplicates)
-                combined_sources = []
-                for step in batch_steps:
-                    for recipe_name in step.source_recipes:
-                        if recipe_name not in combined_sources:
-                            combined_sources.append(recipe_name)
+                time_saved += group.total_duration - group.max_duration
 
                 # Use metadata from first step for equipment/phase
                 first_step = batch_steps[0]
@@ -177,25 +284,26 @@ class PrepOptimizer:
                     step_number=len(optimized_steps) + 1,
                     action=combined_action,
                     ingredient=first_step.ingredient,
-                    duration_minutes=combined_duration,
+                    duration_minutes=group.max_duration,
                     can_batch=True,
                     batch_key=batch_key,
-                    source_recipes=combined_sources,
+                    source_recipes=list(group.sources),
                     equipment=first_step.equipment,
                     is_passive=first_step.is_passive,
                     phase=first_step.phase,
                 )
                 optimized_steps.append(combined_step)
+                total_time += group.max_duration
             else:
                 batch_steps[0].step_number = len(optimized_steps) + 1
                 optimized_steps.append(batch_steps[0])
+                total_time += batch_steps[0].duration_minutes
 
         # Add non-batchable steps
         for step in non_batch_steps:
             step.step_number = len(optimized_steps) + 1
             optimized_steps.append(step)
-
-        total_time = sum(s.duration_minutes for s in optimized_steps)
+            total_time += step.duration_minutes
 
         return OptimizedPrepTimeline(
             total_time_minutes=total_time,
@@ -204,13 +312,6 @@ class PrepOptimizer:
             prep_date=prep_date
         )
 
-    # Common adverbs that should be skipped when extracting action verbs
-    COMMON_ADVERBS = {
-        "finely", "roughly", "thinly", "thickly", "quickly", "slowly",
-        "gently", "vigorously", "carefully", "lightly", "heavily",
-        "generously", "thoroughly", "immediately", "briefly", "well",
-    }
-
     def _combine_batch_steps(self, steps: List[PrepStep]) -> str:
         """
         Combine multiple similar steps into one description.
@@ -233,10 +334,10 @@ class PrepOptimizer:
             # Fallback: extract verb from action, skipping common adverbs
             action_verb = self._extract_action_verb(steps[0].action)
 
-        ingredients = [s.ingredient for s in steps if s.ingredient]
+        # Ingredients in first-seen order, deduplicated in one pass
+        unique_ingredients = list(dict.fromkeys(s.ingredient for s in steps if s.ingredient))
 
-        if ingredients:
-            unique_ingredients = list(dict.fromkeys(ingredients))
+        if unique_ingredients:
             if len(unique_ingredients) == 1:
                 return f"{action_verb.capitalize()} all {unique_ingredients[0]} at once (for {len(steps)} recipes)"
             else:
@@ -251,10 +352,8 @@ class PrepOptimizer:
 
         Fallback for cases where batch_key is not available.
         """
-        words = action.lower().split()
-        for word in words:
-            clean_word = word.rstrip(".,;:")
-            if clean_word not in self.COMMON_ADVERBS and len(clean_word) > 2:
-                return clean_word
+        for word in action.lower().translate(_PUNCTUATION_TABLE).split():
+            if len(word) > 2 and word not in COMMON_ADVERBS:
+                return word
 
         return "prepare"  # Ultimate fallback
@@ -2,9 +2,9 @@
 Utility functions for parsing and combining ingredient quantities.
 Handles various quantity formats and unit conversions.
 """
+import functools
 import re
 from typing import Tuple, Optional
-from fractions import Fraction
 
 
 # Common unit conversions to grams/ml (for standardization)
@@ -62,11 +62,71 @@ UNIT_CONVERSIONS = {
     'small': 1.0,
 }
 
+# Base units returned by normalize_to_base_unit. Every base unit comes from
+# these shared objects, so comparing two of them is an identity check.
+BASE_GRAMS = 'g'
+BASE_ML = 'ml'
+BASE_COUNT = 'count'
+
+# Base unit for each weight and volume unit; any other unit is a count
+_BASE_UNITS = {
+    **dict.fromkeys(
+        ['g', 'gram', 'grams', 'kg', 'kilogram', 'kilograms', 'oz', 'ounce', 'ounces', 'lb', 'pound', 'pounds'],
+        BASE_GRAMS,
+    ),
+    **dict.fromkeys(
+        ['ml', 'milliliter', 'milliliters', 'l', 'liter', 'liters', 'cup', 'cups', 'tbsp', 'tablespoon', 'tablespoons', 'tsp', 'teaspoon', 'teaspoons'],
+        BASE_ML,
+    ),
+}
+
+
+# Spellings of the base units themselves. Unlike _BASE_UNITS this leaves out
+# kg, cups and the like, which reduce_quantity keeps in their own unit.
+_BASE_UNIT_SPELLINGS = {
+    **dict.fromkeys(['g', 'gram', 'grams'], BASE_GRAMS),
+    **dict.fromkeys(['ml', 'milliliter', 'milliliters'], BASE_ML),
+}
 
+
+# Pattern: optional number/fraction + optional unit
+# Examples: "500g", "2 cups", "1/2 cup", "1-2 medium"
+_QUANTITY_RE = re.compile(r'([\d/.]+(?:-[\d/.]+)?)\s*([a-z]+)?')
+
+
+def _parse_amount(amount_str: str) -> Optional[float]:
+    """
+    Parse a single amount, either a plain number or a fraction like "1/2".
+
+    The string is checked up front rather than left to raise, since
+    malformed amounts are expected input here.
+
+    Returns:
+        The amount, or None if it is not a valid number or fraction.
+    """
+    if '/' not in amount_str:
+        # At most one decimal point and at least one digit
+        if amount_str.count('.') > 1 or not amount_str.replace('.', '', 1).isdecimal():
+            return None
+        return float(amount_str)
+    # Only the float value is needed, so skip Fraction's parsing and GCD reduction
+    numerator, _, denominator = amount_str.partition('/')
+    if not (numerator.isdecimal() and denominator.isdecimal()):
+        return None
+    denominator_value = int(denominator)
+    if denominator_value == 0:
+        return None
+    return int(numerator) / denominator_value
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_quantity(quantity_str: str) -> Tuple[float, str, str]:
     """
     Parse a quantity string into amount, unit, and original string.
 
+    Memoized: quantity strings repeat heavily across recipes ("1 cup",
+    "500g"), and the result is an immutable tuple.
+
     Examples:
         "500g" -> (500.0, "g", "500g")
         "2 cups" -> (2.0, "cups", "2 cups")
@@ -83,10 +143,7 @@ def parse_quantity(quantity_str: str) -> Tuple[float, str, str]:
     original = quantity_str.strip()
     text = original.lower()
 
-    # Pattern: optional number/fraction + optional unit
-    # Examples: "500g", "2 cups", "1/2 cup", "1-2 medium"
-    pattern = r'([\d/.]+(?:-[\d/.]+)?)\s*([a-z]+)?'
-    match = re.match(pattern, text)
+    match = _QUANTITY_RE.match(text)
 
     if not match:
         # If no number found, treat as "1 unit" or default to the whole string
@@ -96,17 +153,17 @@ def parse_quantity(quantity_str: str) -> Tuple[float, str, str]:
     unit = match.group(2) if match.group(2) else 'unit'
 
     # Parse amount (handles fractions and ranges)
-    try:
-        if '-' in amount_str:
-            # Range like "2-3" -> take average
-            parts = amount_str.split('-')
-            low = float(Fraction(parts[0]))
-            high = float(Fraction(parts[1]))
-            amount = (low + high) / 2.0
-        else:
-            # Single value or fraction
-            amount = float(Fraction(amount_str))
-    except:
+    if '-' in amount_str:
+        # Range like "2-3" -> take average
+        low_str, _, high_str = amount_str.partition('-')
+        low = _parse_amount(low_str)
+        high = _parse_amount(high_str)
+        amount = None if low is None or high is None else (low + high) / 2.0
+    else:
+        # Single value or fraction
+        amount = _parse_amount(amount_str)
+
+    if amount is None:
         amount = 1.0
 
     return (amount, unit, original)
@@ -123,28 +180,32 @@ def normalize_to_base_unit(amount: float, unit: str) -> Tuple[float, str]:
     Returns:
         Tuple of (normalized_amount, base_unit)
     """
-    unit_lower = unit.lower().strip()
+    return _to_base_unit(amount, unit.lower().strip())
 
-    # Determine base unit category
-    if unit_lower in ['g', 'gram', 'grams', 'kg', 'kilogram', 'kilograms', 'oz', 'ounce', 'ounces', 'lb', 'pound', 'pounds']:
-        # Weight -> grams
-        conversion = UNIT_CONVERSIONS.get(unit_lower, 1.0)
-        return (amount * conversion, 'g')
 
-    elif unit_lower in ['ml', 'milliliter', 'milliliters', 'l', 'liter', 'liters', 'cup', 'cups', 'tbsp', 'tablespoon', 'tablespoons', 'tsp', 'teaspoon', 'teaspoons']:
-        # Volume -> ml
-        conversion = UNIT_CONVERSIONS.get(unit_lower, 1.0)
-        return (amount * conversion, 'ml')
+def _to_base_unit(amount: float, unit_lower: str) -> Tuple[float, str]:
+    """
+    normalize_to_base_unit for a unit that is already lowercased and stripped.
 
-    else:
+    Units returned by parse_quantity always are, so callers holding one can
+    skip normalizing it again.
+    """
+    # Determine base unit category: weight -> grams, volume -> ml
+    base_unit = _BASE_UNITS.get(unit_lower)
+    if base_unit is None:
         # Count-based or descriptive (piece, bunch, clove, etc.)
-        return (amount, 'count')
+        return (amount, BASE_COUNT)
+
+    return (amount * UNIT_CONVERSIONS[unit_lower], base_unit)
 
 
+@functools.lru_cache(maxsize=1024)
 def can_combine_quantities(unit1: str, unit2: str) -> bool:
     """
     Check if two units can be combined.
 
+    Memoized, since only a few dozen unit strings occur in practice.
+
     Args:
         unit1: First unit
         unit2: Second unit
@@ -159,6 +220,37 @@ def can_combine_quantities(unit1: str, unit2: str) -> bool:
     return base1 == base2
 
 
+def _format_grams(total: float, unit: str) -> str:
+    """Format a combined weight in grams."""
+    if total >= 1000:
+        return f"{total/1000:.1f}kg"
+    return f"{int(total)}g"
+
+
+def _format_ml(total: float, unit: str) -> str:
+    """Format a combined volume in ml."""
+    if total >= 1000:
+        return f"{total/1000:.1f}L"
+    if total < 1:
+        return f"{total*1000:.1f}tsp"
+    return f"{int(total)}ml"
+
+
+def _format_count(total: float, unit: str) -> str:
+    """Format a combined count in the original unit."""
+    if total == int(total):
+        return f"{int(total)} {unit}"
+    return f"{total:.1f} {unit}"
+
+
+# Output formatter for each base unit returned by normalize_to_base_unit
+_FORMATTERS = {
+    BASE_GRAMS: _format_grams,
+    BASE_ML: _format_ml,
+    BASE_COUNT: _format_count,
+}
+
+
 def combine_quantities(qty1: str, qty2: str) -> str:
     """
     Combine two quantity strings if compatible.
@@ -178,29 +270,13 @@ def combine_quantities(qty1: str, qty2: str) -> str:
         return f"{orig1} + {orig2}"
 
     # Normalize both to base unit and combine
-    norm_amount1, base_unit = normalize_to_base_unit(amount1, unit1)
-    norm_amount2, _ = normalize_to_base_unit(amount2, unit2)
+    # Units from parse_quantity are already lowercased and stripped
+    norm_amount1, base_unit = _to_base_unit(amount1, unit1)
+    norm_amount2, _ = _to_base_unit(amount2, unit2)
 
     total = norm_amount1 + norm_amount2
 
-    # Format output nicely
-    if base_unit == 'g':
-        if total >= 1000:
-            return f"{total/1000:.1f}kg"
-        else:
-            return f"{int(total)}g"
-    elif base_unit == 'ml':
-        if total >= 1000:
-            return f"{total/1000:.1f}L"
-        elif total < 1:
-            return f"{total*1000:.1f}tsp"
-        else:
-            return f"{int(total)}ml"
-    else:  # count
-        if total == int(total):
-            return f"{int(total)} {unit1}"
-        else:
-            return f"{total:.1f} {unit1}"
+    return _FORMATTERS[base_unit](total, unit1)
 
 
 def reduce_quantity(quantity: str, fraction: float = 0.5) -> str:
@@ -222,10 +298,9 @@ def reduce_quantity(quantity: str, fraction: float = 0.5) -> str:
         return "0"
 
     # Format output
-    if unit in ['g', 'gram', 'grams']:
-        return f"{int(remaining)}g"
-    elif unit in ['ml', 'milliliter', 'milliliters']:
-        return f"{int(remaining)}ml"
+    base_unit = _BASE_UNIT_SPELLINGS.get(unit)
+    if base_unit is not None:
+        return f"{int(remaining)}{base_unit}"
     elif remaining == int(remaining):
         return f"{int(remaining)} {unit}"
     else:
@@ -6,9 +6,9 @@ This module provides:
 - Custom exception classes for specific failure scenarios
 - Error response schema for consistent API responses
 """
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
 
 
 class ErrorCode(str, Enum):
@@ -74,15 +74,19 @@ class ErrorCode(str, Enum):
     SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
 
-class ErrorResponse(BaseModel):
-    """Structured error response for API errors."""
+@dataclass(frozen=True, slots=True)
+class ErrorResponse:
+    """
+    Structured error response for API errors.
+
+    A plain dataclass: its fields come from an already-constructed
+    PrepPilotError, so there is nothing for pydantic to validate.
+    FastAPI serializes dataclasses directly.
+    """
     error_code: ErrorCode
     message: str
     details: Optional[Dict[str, Any]] = None
 
-    class Config:
-        use_enum_values = True
-
 
 class PrepPilotError(Exception):
     """
@@ -91,18 +95,68 @@ class PrepPilotError(Exception):
     Provides structured error information for consistent error handling.
     """
 
+    # BaseException always gives instances a __dict__, so slots do not save
+    # the per-instance dict; they only make these fields faster descriptors.
+    # Subclasses that add fields of their own list them the same way.
+    __slots__ = ("_message", "error_code", "_details", "status_code")
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str],
         error_code: ErrorCode = ErrorCode.INTERNAL_ERROR,
         details: Optional[Dict[str, Any]] = None,
         status_code: int = 500,
     ):
-        self.message = message
+        self._message = message
         self.error_code = error_code
-        self.details = details or {}
+        self._details = details or None
         self.status_code = status_code
-        super().__init__(self.message)
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    @property
+    def message(self) -> str:
+        """Human-readable error message, formatted on first access if not given."""
+        if self._message is None:
+            self._message = self._build_message()
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    def _build_message(self) -> str:
+        """Build the message for an error raised without one."""
+        return ""
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Structured error details, built on first access if not given."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self._details = value
+
+    def _build_details(self) -> Dict[str, Any]:
+        """
+        Build details for an error raised without them.
+
+        Subclasses raised on hot paths keep their raw fields and override
+        this and _build_message, so nothing is formatted unless a response
+        or log actually reads it.
+        """
+        return {}
 
     def to_response(self) -> ErrorResponse:
         """Convert exception to ErrorResponse for API output."""
@@ -118,14 +172,25 @@ class PrepPilotError(Exception):
 class PlanNotFoundError(PrepPilotError):
     """Raised when a meal plan is not found."""
 
+    __slots__ = ("plan_id",)
+
     def __init__(self, plan_id: str, message: str = None):
+        self.plan_id = plan_id
         super().__init__(
-            message=message or f"Meal plan '{plan_id}' not found",
+            message=message or None,
             error_code=ErrorCode.PLAN_NOT_FOUND,
-            details={"plan_id": plan_id},
             status_code=404,
         )
 
+    def _build_message(self) -> str:
+        return f"Meal plan '{self.plan_id}' not found"
+
+    def _build_details(self) -> Dict[str, Any]:
+        return {"plan_id": self.plan_id}
+
+    def __reduce__(self):
+        return (type(self), (self.plan_id, self._message))
+
 
 class NoRecipesAvailableError(PrepPilotError):
     """Raised when no recipes are available for the given criteria."""
@@ -210,18 +275,31 @@ class PlanAdaptationError(PrepPilotError):
 class MealNotFoundError(PrepPilotError):
     """Raised when a specific meal is not found in a plan."""
 
+    __slots__ = ("plan_id", "date", "meal_type")
+
     def __init__(self, plan_id: str, date: str, meal_type: str):
+        self.plan_id = plan_id
+        self.date = date
+        self.meal_type = meal_type
         super().__init__(
-            message=f"Meal '{meal_type}' not found for date {date} in plan",
+            message=None,
             error_code=ErrorCode.PLAN_MEAL_NOT_FOUND,
-            details={
-                "plan_id": plan_id,
-                "date": date,
-                "meal_type": meal_type,
-            },
             status_code=404,
         )
 
+    def _build_message(self) -> str:
+        return f"Meal '{self.meal_type}' not found for date {self.date} in plan"
+
+    def _build_details(self) -> Dict[str, Any]:
+        return {
+            "plan_id": self.plan_id,
+            "date": self.date,
+            "meal_type": self.meal_type,
+        }
+
+    def __reduce__(self):
+        return (type(self), (self.plan_id, self.date, self.meal_type))
+
 
 class PlanLimitExceededError(PrepPilotError):
     """Raised when user has reached the maximum number of meal plans."""
@@ -243,21 +321,30 @@ class PlanLimitExceededError(PrepPilotError):
 class FridgeItemNotFoundError(PrepPilotError):
     """Raised when a fridge item is not found."""
 
-    def __init__(self, item_id: str = None, ingredient_name: str = None):
-        if item_id:
-            message = f"Fridge item '{item_id}' not found"
-            details = {"item_id": item_id}
-        else:
-            message = f"Ingredient '{ingredient_name}' not found in fridge"
-            details = {"ingredient_name": ingredient_name}
+    __slots__ = ("item_id", "ingredient_name")
 
+    def __init__(self, item_id: str = None, ingredient_name: str = None):
+        self.item_id = item_id
+        self.ingredient_name = ingredient_name
         super().__init__(
-            message=message,
+            message=None,
             error_code=ErrorCode.FRIDGE_ITEM_NOT_FOUND,
-            details=details,
             status_code=404,
         )
 
+    def _build_message(self) -> str:
+        if self.item_id:
+            return f"Fridge item '{self.item_id}' not found"
+        return f"Ingredient '{self.ingredient_name}' not found in fridge"
+
+    def _build_details(self) -> Dict[str, Any]:
+        if self.item_id:
+            return {"item_id": self.item_id}
+        return {"ingredient_name": self.ingredient_name}
+
+    def __reduce__(self):
+        return (type(self), (self.item_id, self.ingredient_name))
+
 
 class FridgeOperationError(PrepPilotError):
     """Raised when a fridge operation fails."""
@@ -365,14 +452,25 @@ class PDFGenerationError(ExportError):
 class RecipeNotFoundError(PrepPilotError):
     """Raised when a recipe is not found."""
 
+    __slots__ = ("recipe_id",)
+
     def __init__(self, recipe_id: str):
+        self.recipe_id = recipe_id
         super().__init__(
-            message=f"Recipe '{recipe_id}' not found",
+            message=None,
             error_code=ErrorCode.RECIPE_NOT_FOUND,
-            details={"recipe_id": recipe_id},
             status_code=404,
         )
 
+    def _build_message(self) -> str:
+        return f"Recipe '{self.recipe_id}' not found"
+
+    def _build_details(self) -> Dict[str, Any]:
+        return {"recipe_id": self.recipe_id}
+
+    def __reduce__(self):
+        return (type(self), (self.recipe_id,))
+
 
 class RecipeAlreadyExistsError(PrepPilotError):
     """Raised when trying to create a recipe that already exists."""
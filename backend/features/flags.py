@@ -5,8 +5,9 @@ This module defines all available feature flags and their default states.
 Feature flags can be overridden via environment variables.
 """
 
+import functools
 from enum import Enum
-from typing import Dict
+from typing import ClassVar, Dict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -52,32 +53,33 @@ class Feature(str, Enum):
     OFFLINE_MODE = "offline_mode"
 
 
-# Default states for all features (True = enabled by default)
-DEFAULT_FEATURE_STATES: Dict[Feature, bool] = {
+# Default states for all features (True = enabled by default), keyed by
+# Feature value. Feature members are str, so they look up the same entries.
+DEFAULT_FEATURE_STATES: Dict[str, bool] = {
     # Email features - default enabled (if email is configured)
-    Feature.EMAIL_PLAN_NOTIFICATIONS: True,
-    Feature.EMAIL_EXPIRING_ALERTS: True,
-    Feature.EMAIL_ADAPTATION_SUMMARIES: True,
+    "email_plan_notifications": True,
+    "email_expiring_alerts": True,
+    "email_adaptation_summaries": True,
     # Export features - default enabled
-    Feature.EXPORT_PDF: True,
-    Feature.EXPORT_SHOPPING_LIST: True,
+    "export_pdf": True,
+    "export_shopping_list": True,
     # Plan features - default enabled
-    Feature.PLAN_DUPLICATION: True,
-    Feature.PLAN_ADAPTATION: True,
-    Feature.MEAL_SWAP: True,
+    "plan_duplication": True,
+    "plan_adaptation": True,
+    "meal_swap": True,
     # Fridge features - default enabled
-    Feature.FRIDGE_BULK_IMPORT: True,
-    Feature.FRIDGE_EXPIRING_NOTIFICATIONS: True,
+    "fridge_bulk_import": True,
+    "fridge_expiring_notifications": True,
     # Recipe features - default enabled
-    Feature.RECIPE_SEARCH: True,
-    Feature.RECIPE_BROWSER: True,
+    "recipe_search": True,
+    "recipe_browser": True,
     # Admin features - default enabled
-    Feature.ADMIN_USER_MANAGEMENT: True,
-    Feature.ADMIN_AUDIT_LOGS: True,
+    "admin_user_management": True,
+    "admin_audit_logs": True,
     # Experimental features
-    Feature.PREP_TIMELINE_OPTIMIZATION: True,
-    Feature.LLM_STEP_PARSING: True,  # Enabled by default when OpenAI API key is configured
-    Feature.OFFLINE_MODE: True,
+    "prep_timeline_optimization": True,
+    "llm_step_parsing": True,  # Enabled by default when OpenAI API key is configured
+    "offline_mode": True,
 }
 
 
@@ -94,49 +96,35 @@ class FeatureFlags(BaseSettings):
     """
 
     # Email features
-    feature_email_plan_notifications: bool = DEFAULT_FEATURE_STATES[
-        Feature.EMAIL_PLAN_NOTIFICATIONS
-    ]
-    feature_email_expiring_alerts: bool = DEFAULT_FEATURE_STATES[
-        Feature.EMAIL_EXPIRING_ALERTS
-    ]
-    feature_email_adaptation_summaries: bool = DEFAULT_FEATURE_STATES[
-        Feature.EMAIL_ADAPTATION_SUMMARIES
-    ]
+    feature_email_plan_notifications: bool = DEFAULT_FEATURE_STATES["email_plan_notifications"]
+    feature_email_expiring_alerts: bool = DEFAULT_FEATURE_STATES["email_expiring_alerts"]
+    feature_email_adaptation_summaries: bool = DEFAULT_FEATURE_STATES["email_adaptation_summaries"]
 
     # Export features
-    feature_export_pdf: bool = DEFAULT_FEATURE_STATES[Feature.EXPORT_PDF]
-    feature_export_shopping_list: bool = DEFAULT_FEATURE_STATES[
-        Feature.EXPORT_SHOPPING_LIST
-    ]
+    feature_export_pdf: bool = DEFAULT_FEATURE_STATES["export_pdf"]
+    feature_export_shopping_list: bool = DEFAULT_FEATURE_STATES["export_shopping_list"]
 
     # Plan features
-    feature_plan_duplication: bool = DEFAULT_FEATURE_STATES[Feature.PLAN_DUPLICATION]
-    feature_plan_adaptation: bool = DEFAULT_FEATURE_STATES[Feature.PLAN_ADAPTATION]
-    feature_meal_swap: bool = DEFAULT_FEATURE_STATES[Feature.MEAL_SWAP]
+    feature_plan_duplication: bool = DEFAULT_FEATURE_STATES["plan_duplication"]
+    feature_plan_adaptation: bool = DEFAULT_FEATURE_STATES["plan_adaptation"]
+    feature_meal_swap: bool = DEFAULT_FEATURE_STATES["meal_swap"]
 
     # Fridge features
-    feature_fridge_bulk_import: bool = DEFAULT_FEATURE_STATES[Feature.FRIDGE_BULK_IMPORT]
-    feature_fridge_expiring_notifications: bool = DEFAULT_FEATURE_STATES[
-        Feature.FRIDGE_EXPIRING_NOTIFICATIONS
-    ]
+    feature_fridge_bulk_import: bool = DEFAULT_FEATURE_STATES["fridge_bulk_import"]
+    feature_fridge_expiring_notifications: bool = DEFAULT_FEATURE_STATES["fridge_expiring_notifications"]
 
     # Recipe features
-    feature_recipe_search: bool = DEFAULT_FEATURE_STATES[Feature.RECIPE_SEARCH]
-    feature_recipe_browser: bool = DEFAULT_FEATURE_STATES[Feature.RECIPE_BROWSER]
+    feature_recipe_search: bool = DEFAULT_FEATURE_STATES["recipe_search"]
+    feature_recipe_browser: bool = DEFAULT_FEATURE_STATES["recipe_browser"]
 
     # Admin features
-    feature_admin_user_management: bool = DEFAULT_FEATURE_STATES[
-        Feature.ADMIN_USER_MANAGEMENT
-    ]
-    feature_admin_audit_logs: bool = DEFAULT_FEATURE_STATES[Feature.ADMIN_AUDIT_LOGS]
+    feature_admin_user_management: bool = DEFAULT_FEATURE_STATES["admin_user_management"]
+    feature_admin_audit_logs: bool = DEFAULT_FEATURE_STATES["admin_audit_logs"]
 
     # Experimental features
-    feature_prep_timeline_optimization: bool = DEFAULT_FEATURE_STATES[
-        Feature.PREP_TIMELINE_OPTIMIZATION
-    ]
-    feature_llm_step_parsing: bool = DEFAULT_FEATURE_STATES[Feature.LLM_STEP_PARSING]
-    feature_offline_mode: bool = DEFAULT_FEATURE_STATES[Feature.OFFLINE_MODE]
+    feature_prep_timeline_optimization: bool = DEFAULT_FEATURE_STATES["prep_timeline_optimization"]
+    feature_llm_step_parsing: bool = DEFAULT_FEATURE_STATES["llm_step_parsing"]
+    feature_offline_mode: bool = DEFAULT_FEATURE_STATES["offline_mode"]
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -145,6 +133,11 @@ class FeatureFlags(BaseSettings):
         extra="ignore",  # Ignore non-feature-flag environment variables
     )
 
+    # Settings attribute backing each feature, built once at class load
+    _FEATURE_ATTR: ClassVar[Dict[Feature, str]] = {
+        feature: f"feature_{feature.value}" for feature in Feature
+    }
+
     def get_flag(self, feature: Feature) -> bool:
         """
         Get the current state of a feature flag.
@@ -155,8 +148,9 @@ class FeatureFlags(BaseSettings):
         Returns:
             True if the feature is enabled, False otherwise
         """
-        attr_name = f"feature_{feature.value}"
-        return getattr(self, attr_name, DEFAULT_FEATURE_STATES.get(feature, False))
+        return getattr(
+            self, self._FEATURE_ATTR[feature], DEFAULT_FEATURE_STATES.get(feature.value, False)
+        )
 
     def get_all_flags(self) -> Dict[str, bool]:
         """
@@ -165,7 +159,16 @@ class FeatureFlags(BaseSettings):
         Returns:
             Dictionary mapping feature names to their enabled states
         """
-        return {feature.value: self.get_flag(feature) for feature in Feature}
+        return {
+            feature.value: getattr(self, attr_name, DEFAULT_FEATURE_STATES.get(feature.value, False))
+            for feature, attr_name in self._FEATURE_ATTR.items()
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _default_feature_flags() -> FeatureFlags:
+    """Build the environment-configured FeatureFlags once and share it."""
+    return FeatureFlags()
 
 
 def get_feature_flags(**overrides) -> FeatureFlags:
@@ -173,7 +176,9 @@ def get_feature_flags(**overrides) -> FeatureFlags:
     Factory function to create FeatureFlags instance.
 
     Useful for testing where you need to override specific flags
-    without modifying environment variables.
+    without modifying environment variables. Without overrides the
+    shared instance is returned, so the environment and .env file are
+    only read once.
 
     Args:
         **overrides: Key-value pairs to override default flags
@@ -181,6 +186,8 @@ def get_feature_flags(**overrides) -> FeatureFlags:
     Returns:
         FeatureFlags instance with overrides applied
     """
+    if not overrides:
+        return _default_feature_flags()
     return FeatureFlags(**overrides)
 
 
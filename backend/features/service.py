@@ -5,6 +5,8 @@ This service provides a clean interface for checking feature flag states
 and can be injected into route handlers as a dependency.
 """
 
+import functools
+import time
 from typing import Dict, Optional
 from fastapi import Depends, HTTPException, status
 
@@ -18,10 +20,16 @@ class FeatureFlagService:
     This service provides methods to check if features are enabled
     and to retrieve information about all feature flags.
 
+    Flag states are read from a snapshot of all flags that is refreshed at
+    most every CACHE_TTL_SECONDS, so a check on a hot route is a single
+    dict lookup.
+
     Attributes:
         flags: The FeatureFlags configuration instance
     """
 
+    CACHE_TTL_SECONDS = 1.0
+
     def __init__(self, flags: Optional[FeatureFlags] = None):
         """
         Initialize the feature flag service.
@@ -30,6 +38,20 @@ class FeatureFlagService:
             flags: Optional FeatureFlags instance. Uses global instance if not provided.
         """
         self.flags = flags or feature_flags
+        self._cache: Dict[str, bool] = {}
+        self._cache_ts = 0.0
+
+    def _snapshot(self) -> Dict[str, bool]:
+        """Return the cached flag states, refreshing them once they are stale."""
+        now = time.monotonic()
+        if not self._cache or now - self._cache_ts >= self.CACHE_TTL_SECONDS:
+            self._cache = self.flags.get_all_flags()
+            self._cache_ts = now
+        return self._cache
+
+    def invalidate(self) -> None:
+        """Drop the cached flag states so the next check re-reads them."""
+        self._cache = {}
 
     def is_enabled(self, feature: Feature) -> bool:
         """
@@ -46,7 +68,7 @@ class FeatureFlagService:
                 # Allow plan duplication
                 pass
         """
-        return self.flags.get_flag(feature)
+        return self._snapshot()[feature.value]
 
     def require_feature(self, feature: Feature) -> None:
         """
@@ -75,7 +97,7 @@ class FeatureFlagService:
         Returns:
             Dictionary mapping feature names to their enabled states
         """
-        return self.flags.get_all_flags()
+        return dict(self._snapshot())
 
     def get_enabled_features(self) -> list[str]:
         """
@@ -84,7 +106,7 @@ class FeatureFlagService:
         Returns:
             List of enabled feature names
         """
-        return [name for name, enabled in self.get_all_flags().items() if enabled]
+        return [name for name, enabled in self._snapshot().items() if enabled]
 
     def get_disabled_features(self) -> list[str]:
         """
@@ -93,16 +115,16 @@ class FeatureFlagService:
         Returns:
             List of disabled feature names
         """
-        return [name for name, enabled in self.get_all_flags().items() if not enabled]
+        return [name for name, enabled in self._snapshot().items() if not enabled]
 
 
 # Global service instance
-_feature_service: Optional[FeatureFlagService] = None
+feature_service = FeatureFlagService()
 
 
 def get_feature_service() -> FeatureFlagService:
     """
-    Get or create the global feature flag service instance.
+    Get the global feature flag service instance.
 
     This is used as a FastAPI dependency for injecting the service
     into route handlers.
@@ -110,16 +132,17 @@ def get_feature_service() -> FeatureFlagService:
     Returns:
         The global FeatureFlagService instance
     """
-    global _feature_service
-    if _feature_service is None:
-        _feature_service = FeatureFlagService()
-    return _feature_service
+    return feature_service
 
 
+@functools.lru_cache(maxsize=None)
 def require_feature(feature: Feature):
     """
     FastAPI dependency factory that requires a feature to be enabled.
 
+    Memoized per feature, so every route gated on the same feature shares
+    one dependency callable and FastAPI resolves it once per request.
+
     Usage:
         @app.post("/plans/{plan_id}/duplicate")
         def duplicate_plan(
@@ -4,65 +4,81 @@ Background job for daily freshness decay.
 This job runs once per day to decay the freshness of all fridge items
 for all users.
 """
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import case, delete, select, update
 from sqlalchemy.orm import Session
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import groupby
 import logging
 
 from backend.db.database import SessionLocal
 from backend.db.models import User, FridgeItem
 from backend.config import settings
 from backend.services.email_service import EmailService
-from backend.services.fridge_service import FridgeService
+from backend.jobs.prep_precompute import precompute_prep_parsing
 from backend.models.schemas import FridgeItem as FridgeItemSchema
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming job queries
+STREAM_BATCH_SIZE = 500
+
 
 def decay_all_fridge_items():
     """
     Decay freshness for all fridge items across all users.
 
-    This function:
-    1. Gets all users
-    2. For each user, decays their fridge items by 1 day
-    3. Logs the results
+    Decrements days_remaining (floored at 0) for every item owned by an
+    active user without loading rows into the session. Items are updated
+    in primary-key order, settings.freshness_decay_batch_size at a time,
+    committing after each batch so no single statement locks the whole
+    table.
     """
     db: Session = SessionLocal()
 
     try:
         logger.info("Starting daily freshness decay job...")
 
-        # Get all active users
-        users = db.query(User).filter(User.is_active == True).all()
+        active_user_ids = select(User.id).where(User.is_active == True)
+        decayed_days = case(
+            (FridgeItem.days_remaining > 0, FridgeItem.days_remaining - 1),
+            else_=0,
+        )
 
         total_items_updated = 0
-        users_processed = 0
-
-        for user in users:
-            # Get all fridge items for this user
-            items = db.query(FridgeItem).filter(FridgeItem.user_id == user.id).all()
-
-            if not items:
-                continue
-
-            items_updated = 0
-            for item in items:
-                # Decay freshness by 1 day
-                item.days_remaining = max(0, item.days_remaining - 1)
-                items_updated += 1
-
-            total_items_updated += items_updated
-            users_processed += 1
-
-            logger.info(f"Decayed {items_updated} items for user {user.email}")
-
-        # Commit all changes
-        db.commit()
+        batches = 0
+        last_id = None
+
+        while True:
+            batch_query = (
+                select(FridgeItem.id)
+                .where(FridgeItem.user_id.in_(active_user_ids))
+                .order_by(FridgeItem.id)
+                .limit(settings.freshness_decay_batch_size)
+            )
+            if last_id is not None:
+                batch_query = batch_query.where(FridgeItem.id > last_id)
+
+            item_ids = db.scalars(batch_query).all()
+            if not item_ids:
+                break
+
+            result = db.execute(
+                update(FridgeItem)
+                .where(FridgeItem.id.in_(item_ids))
+                .values(days_remaining=decayed_days)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            total_items_updated += result.rowcount
+            batches += 1
+            last_id = item_ids[-1]
 
         logger.info(
             f"Freshness decay job completed. "
-            f"Processed {users_processed} users, updated {total_items_updated} items."
+            f"Updated {total_items_updated} items in {batches} batches."
         )
 
     except Exception as e:
@@ -78,6 +94,8 @@ def remove_expired_items():
     Remove items that have expired (days_remaining = 0 for more than 7 days).
 
     This is a cleanup job to prevent the database from growing indefinitely.
+    Items are deleted settings.expired_items_cleanup_batch_size at a time,
+    committing after each batch so no single statement holds long locks.
     """
     db: Session = SessionLocal()
 
@@ -86,11 +104,25 @@ def remove_expired_items():
 
         # Delete items with 0 days remaining
         # In a real system, you might want to keep them for a grace period
-        deleted_count = db.query(FridgeItem).filter(
-            FridgeItem.days_remaining == 0
-        ).delete(synchronize_session=False)
-
-        db.commit()
+        deleted_count = 0
+        while True:
+            item_ids = db.scalars(
+                select(FridgeItem.id)
+                .where(FridgeItem.days_remaining == 0)
+                .limit(settings.expired_items_cleanup_batch_size)
+            ).all()
+            if not item_ids:
+                break
+
+            result = db.execute(
+                delete(FridgeItem)
+                .where(FridgeItem.id.in_(item_ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+            deleted_count += result.rowcount
+            logger.info(f"Removed batch of {result.rowcount} expired items.")
 
         logger.info(f"Removed {deleted_count} expired items from database.")
 
@@ -117,37 +149,69 @@ def send_expiring_item_alerts():
     try:
         logger.info("Starting expiring item alerts job...")
 
-        users = db.query(User).filter(User.is_active == True).all()
-        emails_sent = 0
+        # One query for every active user's items expiring within 2 days,
+        # streamed so only a batch of rows is held in memory at a time
+        rows = (
+            db.query(User, FridgeItem)
+            .join(FridgeItem, FridgeItem.user_id == User.id)
+            .filter(
+                User.is_active == True,
+                FridgeItem.days_remaining > 0,
+                FridgeItem.days_remaining <= 2,
+            )
+            .order_by(User.id, FridgeItem.days_remaining)
+            .yield_per(STREAM_BATCH_SIZE)
+        )
 
         email_service = EmailService(db)
-        fridge_service = FridgeService(db)
-
-        for user in users:
-            # Get items expiring within 2 days
-            expiring_items = fridge_service.get_expiring_items(user, days_threshold=2)
-
-            if not expiring_items:
-                continue
-
-            # Convert to schema
-            schema_items = [
-                FridgeItemSchema(
-                    ingredient_name=item.ingredient_name,
-                    quantity=item.quantity,
-                    days_remaining=item.days_remaining,
-                    added_date=item.added_date,
-                    original_freshness_days=item.original_freshness_days,
-                )
-                for item in expiring_items
-            ]
-
-            # Send email
+
+        def send_alert(user: User, schema_items) -> bool:
             if email_service.send_expiring_items_alert(user, schema_items):
-                emails_sent += 1
-                logger.info(f"Sent expiring items alert to {user.email}")
+                # Per-user detail only at DEBUG; the job logs one summary line
+                logger.debug("Sent expiring items alert to %s", user.email)
+                return True
+            return False
+
+        # Sending is SMTP round trips (and retry backoff), so overlap them.
+        # Each user's alert is submitted as their rows stream in, and at most
+        # max_in_flight alerts are pending, so memory stays bounded.
+        max_workers = max(1, settings.email_max_concurrency)
+        max_in_flight = 2 * max_workers
+        pending = set()
+        alerts_queued = 0
+        emails_sent = 0
 
-        logger.info(f"Expiring item alerts job completed. Sent {emails_sent} emails.")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _, user_rows in groupby(rows, key=lambda row: row[0].id):
+                user_rows = list(user_rows)
+                user = user_rows[0][0]
+
+                # Convert to schema; rows come straight from the database, so
+                # skip validation
+                schema_items = [
+                    FridgeItemSchema.model_construct(
+                        ingredient_name=item.ingredient_name,
+                        quantity=item.quantity,
+                        days_remaining=item.days_remaining,
+                        added_date=item.added_date,
+                        original_freshness_days=item.original_freshness_days,
+                    )
+                    for _, item in user_rows
+                ]
+
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    emails_sent += sum(future.result() for future in done)
+
+                pending.add(executor.submit(send_alert, user, schema_items))
+                alerts_queued += 1
+
+            emails_sent += sum(future.result() for future in pending)
+
+        logger.info(
+            f"Expiring item alerts job completed. Sent {emails_sent} of "
+            f"{alerts_queued} alert emails."
+        )
 
     except Exception as e:
         logger.error(f"Error in expiring item alerts job: {str(e)}")
@@ -156,14 +220,28 @@ def send_expiring_item_alerts():
         db.close()
 
 
-def setup_scheduler() -> BackgroundScheduler:
+def setup_scheduler() -> AsyncIOScheduler:
     """
     Set up the background scheduler with daily freshness decay job.
 
+    The scheduler runs on the application's event loop instead of its own
+    thread. The jobs are synchronous, so it hands them to the loop's
+    default executor, which keeps their database work off the loop.
+
+    Must be called while the event loop is running (e.g. from lifespan).
+
     Returns:
         Configured scheduler instance
     """
-    scheduler = BackgroundScheduler()
+    # One run at a time per job, and after downtime run a missed job once
+    # (within the hour) instead of skipping it or replaying every miss
+    scheduler = AsyncIOScheduler(
+        job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": 3600,
+        }
+    )
 
     # Schedule freshness decay job to run daily at configured hour (default midnight)
     scheduler.add_job(
@@ -201,6 +279,20 @@ def setup_scheduler() -> BackgroundScheduler:
 
     logger.info("Scheduled expiring item alerts job to run daily at 8:00 AM")
 
+    # Schedule Batch API parsing of upcoming plans' recipes to warm the step cache
+    scheduler.add_job(
+        precompute_prep_parsing,
+        trigger=CronTrigger(hour=settings.prep_precompute_hour, minute=0),
+        id='prep_parsing_precompute',
+        name='Daily prep parsing precompute',
+        replace_existing=True,
+    )
+
+    logger.info(
+        f"Scheduled prep parsing precompute job to run daily at "
+        f"{settings.prep_precompute_hour}:00"
+    )
+
     return scheduler
 
 
@@ -222,7 +314,7 @@ def start_scheduler():
     return scheduler
 
 
-def stop_scheduler(scheduler: BackgroundScheduler):
+def stop_scheduler(scheduler: AsyncIOScheduler):
     """
     Stop the background scheduler gracefully.
 
@@ -0,0 +1,52 @@
+"""
+Background job for parsing upcoming meal plans' recipes ahead of time.
+
+Runs once per day so prep timelines for current and future plans are
+served from the step cache. Steps go through the OpenAI Batch API, which is
+half the price of live calls; nothing happens when LLM parsing is off.
+"""
+from datetime import date
+from sqlalchemy.orm import Session
+import logging
+
+from backend.db.database import SessionLocal
+from backend.db.models import MealPlan
+from backend.engine.prep_optimizer import PrepOptimizer
+from backend.services.meal_service import db_meal_plan_to_schema
+
+logger = logging.getLogger(__name__)
+
+
+def precompute_prep_parsing():
+    """
+    Batch-parse the recipes of every meal plan that hasn't ended yet.
+
+    The plans are loaded and the session closed before the batch is
+    submitted, since waiting on the Batch API can take hours and must not
+    hold a database connection open.
+    """
+    try:
+        logger.info("Starting prep parsing precompute job...")
+
+        optimizer = PrepOptimizer()
+        if not optimizer.supports_batch:
+            logger.info("Prep parsing precompute job skipped: parser has no Batch API support.")
+            return
+
+        db: Session = SessionLocal()
+        try:
+            db_plans = db.query(MealPlan).filter(MealPlan.end_date >= date.today()).all()
+            meal_plans = [db_meal_plan_to_schema(db_plan, db) for db_plan in db_plans]
+        finally:
+            db.close()
+
+        recipes_submitted = optimizer.precompute_meal_plans(meal_plans)
+
+        logger.info(
+            f"Prep parsing precompute job completed. "
+            f"Parsed {recipes_submitted} recipes from {len(meal_plans)} plans."
+        )
+
+    except Exception as e:
+        logger.error(f"Error in prep parsing precompute job: {str(e)}")
+        raise
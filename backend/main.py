@@ -4,10 +4,12 @@ PrepPilot FastAPI application.
 Main application entry point with route registration, CORS, and background jobs.
 """
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
+import time
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -108,19 +110,42 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint with database connectivity test."""
-    db_status = "healthy"
-    db_error = None
+# How long a database ping result is reused by /health; liveness probes from
+# every replica would otherwise each cost a database roundtrip.
+HEALTH_CHECK_CACHE_SECONDS = 2.0
+
+# Starts expired so the first /health call always pings, however soon after boot
+_health_cache = {"ts": float("-inf"), "status": "healthy", "error": None}
+
 
+def _ping_database() -> None:
+    """Run a trivial query on a pooled connection, raising on failure."""
+    db = SessionLocal()
     try:
-        db = SessionLocal()
         db.execute(text("SELECT 1"))
+    finally:
         db.close()
-    except Exception as e:
-        db_status = "unhealthy"
-        db_error = str(e)
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint with database connectivity test."""
+    now = time.monotonic()
+    if now - _health_cache["ts"] >= HEALTH_CHECK_CACHE_SECONDS:
+        db_status = "healthy"
+        db_error = None
+
+        try:
+            # Off the event loop so a slow database doesn't stall other requests
+            await run_in_threadpool(_ping_database)
+        except Exception as e:
+            db_status = "unhealthy"
+            db_error = str(e)
+
+        _health_cache.update(ts=now, status=db_status, error=db_error)
+
+    db_status = _health_cache["status"]
+    db_error = _health_cache["error"]
 
     overall_status = "healthy" if db_status == "healthy" else "unhealthy"
 
@@ -13,14 +13,15 @@ Security Model:
 - API-only requests (with Authorization header) bypass validation in debug mode
 """
 
+import functools
 import logging
-from typing import List, Optional, Set
+import re
+from typing import FrozenSet, List, Optional, Set
 from urllib.parse import urlparse
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +31,19 @@ UNSAFE_METHODS: Set[str] = {"POST", "PUT", "PATCH", "DELETE"}
 # HTTP methods that are read-only and don't require CSRF protection
 SAFE_METHODS: Set[str] = {"GET", "HEAD", "OPTIONS"}
 
+# User-Agent substrings that mark a request as coming from a browser
+BROWSER_USER_AGENT_RE = re.compile(
+    r"mozilla|chrome|safari|firefox|edge", re.IGNORECASE
+)
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+
+@functools.lru_cache(maxsize=64)
+def _build_origin(scheme: str, host: str) -> str:
+    """Build a lowercased origin string from a scheme and host."""
+    return f"{scheme}://{host}".lower()
+
+
+class CSRFMiddleware:
     """
     Middleware that validates Origin/Referer headers for state-changing requests.
 
@@ -39,6 +51,10 @@ class CSRFMiddleware(BaseHTTPMiddleware):
     trusted origins. It's a defense-in-depth measure that complements the
     Bearer token authentication scheme.
 
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, so safe-method
+    and non-HTTP traffic is handed straight to the app without building a
+    Request or wrapping the response stream.
+
     Configuration:
         - allowed_origins: List of trusted origins (e.g., ["http://localhost:3000"])
         - enabled: Whether CSRF protection is active (disable in tests if needed)
@@ -47,21 +63,27 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         allowed_origins: List[str],
         enabled: bool = True,
         exempt_paths: Optional[List[str]] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.allowed_origins = set(self._normalize_origins(allowed_origins))
         self.enabled = enabled
-        self.exempt_paths = set(exempt_paths or [])
+        # str.startswith takes a tuple and checks every prefix in C
+        self._exempt_prefixes = tuple(dict.fromkeys(exempt_paths or []))
 
         logger.info(
             f"CSRF middleware initialized: enabled={enabled}, "
             f"origins={self.allowed_origins}"
         )
 
+    @property
+    def exempt_paths(self) -> FrozenSet[str]:
+        """Paths that bypass CSRF validation, fixed at construction."""
+        return frozenset(self._exempt_prefixes)
+
     def _normalize_origins(self, origins: List[str]) -> List[str]:
         """Normalize origins by removing trailing slashes."""
         return [origin.rstrip("/").lower() for origin in origins]
@@ -109,9 +131,9 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             True if the origin matches the server's host
         """
         # Build server origin from request
-        scheme = request.url.scheme
-        host = request.headers.get("host", "")
-        server_origin = f"{scheme}://{host}".lower()
+        server_origin = _build_origin(
+            request.url.scheme, request.headers.get("host", "")
+        )
 
         return origin == server_origin
 
@@ -131,11 +153,8 @@ class CSRFMiddleware(BaseHTTPMiddleware):
         # For security, we require origin for unsafe methods in browser contexts
         if origin is None:
             # Check if it looks like a browser request
-            user_agent = request.headers.get("user-agent", "").lower()
-            is_browser = any(
-                browser in user_agent
-                for browser in ["mozilla", "chrome", "safari", "firefox", "edge"]
-            )
+            user_agent = request.headers.get("user-agent", "")
+            is_browser = BROWSER_USER_AGENT_RE.search(user_agent) is not None
 
             # Non-browser clients (curl, Postman, scripts) don't send Origin
             # These are typically trusted API clients with Bearer tokens
@@ -162,32 +181,30 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
     def _is_exempt_path(self, path: str) -> bool:
         """Check if the path is exempt from CSRF validation."""
-        return any(path.startswith(exempt) for exempt in self.exempt_paths)
+        return path.startswith(self._exempt_prefixes)
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and validate CSRF for unsafe methods.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware/route handler
-
-        Returns:
-            The response from the next handler, or a 403 error
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
-        # Skip validation if middleware is disabled
-        if not self.enabled:
-            return await call_next(request)
-
-        # Skip validation for safe methods
-        if request.method in SAFE_METHODS:
-            return await call_next(request)
-
-        # Skip validation for exempt paths
-        if self._is_exempt_path(request.url.path):
-            return await call_next(request)
+        # Skip validation if middleware is disabled, for non-HTTP traffic
+        # (websockets, lifespan), for safe methods and for exempt paths.
+        # These only read the scope, so no Request is built for them.
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or self._is_exempt_path(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Validate origin for unsafe methods
         origin = self._extract_origin(request)
@@ -199,12 +216,14 @@ class CSRFMiddleware(BaseHTTPMiddleware):
                 f"client={request.client.host if request.client else 'unknown'}"
             )
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={
                     "detail": "CSRF validation failed. Request origin not allowed.",
                     "error": "csrf_validation_failed",
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -1,12 +1,13 @@
 """
 Pydantic data models for PrepPilot adaptive engine.
 """
+from collections import defaultdict
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class UserRole(str, Enum):
@@ -95,21 +96,21 @@ class DietaryExclusion(str, Enum):
 
 
 # Category taxonomy - maps exclusion categories to ingredient patterns
-EXCLUSION_CATEGORIES: Dict[str, List[str]] = {
-    "tree_nuts": ["almonds", "cashews", "walnuts", "pecans", "pistachios", "hazelnuts", "macadamia", "pine_nuts", "brazil_nuts"],
-    "shellfish": ["shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"],
-    "fish": ["salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies"],
-    "seafood": ["salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies",
-                "shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"],
-    "all_seafood": ["salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies",
-                    "shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"],
-    "nightshades": ["tomato", "tomatoes", "pepper", "peppers", "bell_pepper", "eggplant", "aubergine", "paprika", "cayenne", "chili"],
-    "dairy": ["milk", "cheese", "butter", "cream", "yogurt", "sour_cream", "cheddar", "mozzarella", "parmesan", "feta"],
-    "gluten": ["wheat", "barley", "rye", "spelt", "wheat_flour", "bread_crumbs", "pasta"],
-    "all_nuts": ["peanuts", "almonds", "cashews", "walnuts", "pecans", "pistachios", "hazelnuts", "macadamia", "pine_nuts", "brazil_nuts"],
-    "red_meat": ["beef", "lamb", "pork", "veal", "venison", "bison"],
-    "poultry": ["chicken", "turkey", "duck", "chicken_breast", "chicken_thighs"],
-    "pork": ["pork", "bacon", "ham", "pork_chops", "sausage"],
+EXCLUSION_CATEGORIES: Dict[str, FrozenSet[str]] = {
+    "tree_nuts": frozenset({"almonds", "cashews", "walnuts", "pecans", "pistachios", "hazelnuts", "macadamia", "pine_nuts", "brazil_nuts"}),
+    "shellfish": frozenset({"shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"}),
+    "fish": frozenset({"salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies"}),
+    "seafood": frozenset({"salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies",
+                          "shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"}),
+    "all_seafood": frozenset({"salmon", "tuna", "cod", "halibut", "trout", "tilapia", "mackerel", "sardines", "anchovies",
+                              "shrimp", "crab", "lobster", "crayfish", "prawns", "mussels", "clams", "oysters", "scallops"}),
+    "nightshades": frozenset({"tomato", "tomatoes", "pepper", "peppers", "bell_pepper", "eggplant", "aubergine", "paprika", "cayenne", "chili"}),
+    "dairy": frozenset({"milk", "cheese", "butter", "cream", "yogurt", "sour_cream", "cheddar", "mozzarella", "parmesan", "feta"}),
+    "gluten": frozenset({"wheat", "barley", "rye", "spelt", "wheat_flour", "bread_crumbs", "pasta"}),
+    "all_nuts": frozenset({"peanuts", "almonds", "cashews", "walnuts", "pecans", "pistachios", "hazelnuts", "macadamia", "pine_nuts", "brazil_nuts"}),
+    "red_meat": frozenset({"beef", "lamb", "pork", "veal", "venison", "bison"}),
+    "poultry": frozenset({"chicken", "turkey", "duck", "chicken_breast", "chicken_thighs"}),
+    "pork": frozenset({"pork", "bacon", "ham", "pork_chops", "sausage"}),
 }
 
 
@@ -198,24 +199,68 @@ class FridgeItem(BaseModel):
 
 
 class FridgeState(BaseModel):
-    """Current state of ingredient inventory."""
+    """
+    Current state of ingredient inventory.
+
+    Items are indexed by casefolded ingredient name, so finding an item
+    that is present doesn't scan the list. ``items`` is a public list that
+    callers may change directly, so every index hit is checked against the
+    item at that position, and a miss is confirmed with a scan. Whenever
+    either check finds the index out of date, it is rebuilt.
+    """
     user_id: UUID
     items: List[FridgeItem] = Field(default_factory=list)
     last_updated: datetime = Field(default_factory=datetime.now)
 
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed_items: Optional[List[FridgeItem]] = PrivateAttr(default=None)
+
+    def _rebuild_index(self) -> None:
+        """Index the current items by casefolded name."""
+        index: Dict[str, int] = {}
+        for position, item in enumerate(self.items):
+            # First match wins, as with a linear scan
+            index.setdefault(item.ingredient_name.casefold(), position)
+        self._index = index
+        self._indexed_items = self.items
+
+    def _find(self, key: str) -> Optional[int]:
+        """Return the position of the item with the casefolded name key."""
+        items = self.items
+        if self._indexed_items is not items:
+            self._rebuild_index()
+
+        position = self._index.get(key)
+        if (
+            position is not None
+            and position < len(items)
+            and items[position].ingredient_name.casefold() == key
+        ):
+            return position
+
+        # The index missed or was stale; scan to be sure
+        for position, item in enumerate(items):
+            if item.ingredient_name.casefold() == key:
+                self._rebuild_index()
+                return position
+        if key in self._index:
+            self._rebuild_index()
+        return None
+
     def get_item(self, ingredient_name: str) -> Optional[FridgeItem]:
         """Get item by ingredient name."""
-        for item in self.items:
-            if item.ingredient_name.lower() == ingredient_name.lower():
-                return item
-        return None
+        position = self._find(ingredient_name.casefold())
+        return None if position is None else self.items[position]
 
     def add_item(self, item: FridgeItem) -> None:
-        """Add or update item in fridge."""
-        existing = self.get_item(item.ingredient_name)
-        if existing:
-            self.items.remove(existing)
-        self.items.append(item)
+        """Add item to fridge, replacing an existing item in place."""
+        key = item.ingredient_name.casefold()
+        position = self._find(key)
+        if position is None:
+            self._index[key] = len(self.items)
+            self.items.append(item)
+        else:
+            self.items[position] = item
 
     def get_expiring_soon(self, days_threshold: int = 2) -> List[FridgeItem]:
         """Get items expiring within threshold days."""
@@ -241,21 +286,34 @@ class MealPlan(BaseModel):
     meals: List[MealSlot] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
 
+    def meals_by_date(self) -> Dict[date, List[MealSlot]]:
+        """Get meals grouped by date, in plan order within each date."""
+        by_date: Dict[date, List[MealSlot]] = defaultdict(list)
+        for meal in self.meals:
+            by_date[meal.date].append(meal)
+        return dict(by_date)
+
     def get_meals_by_date(self, target_date: date) -> List[MealSlot]:
         """Get all meals for a specific date."""
         return [meal for meal in self.meals if meal.date == target_date]
 
+    def iter_pending_meals(self) -> Iterator[MealSlot]:
+        """Iterate over pending meals without building a list."""
+        pending = PrepStatus.PENDING
+        return (meal for meal in self.meals if meal.prep_status == pending)
+
     def get_pending_meals(self) -> List[MealSlot]:
         """Get all pending meals."""
-        return [meal for meal in self.meals if meal.prep_status == PrepStatus.PENDING]
+        return list(self.iter_pending_meals())
 
     def get_missed_preps(self, current_date: date) -> List[date]:
         """Get dates with skipped or overdue preps."""
-        missed = []
-        for meal in self.meals:
-            if meal.date < current_date and meal.prep_status != PrepStatus.DONE:
-                if meal.date not in missed:
-                    missed.append(meal.date)
+        done = PrepStatus.DONE
+        missed = {
+            meal.date
+            for meal in self.meals
+            if meal.date < current_date and meal.prep_status != done
+        }
         return sorted(missed)
 
 
@@ -1,10 +1,11 @@
 """
 Adaptive planning service that wraps the adaptive engine with database persistence.
 """
+from collections import Counter
 from datetime import date
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from backend.db.models import User, MealPlan, MealSlot, Recipe as DBRecipe
 from backend.models.schemas import (
@@ -16,6 +17,11 @@ from backend.services.meal_service import db_meal_plan_to_schema, db_recipe_to_s
 from backend.services.fridge_service import FridgeService
 
 
+def _slot_signature(slot: MealSlot) -> tuple:
+    """Identify a meal slot by what it schedules, ignoring its row id."""
+    return (slot.date, slot.meal_type, slot.recipe_id, slot.prep_status, slot.prep_completed_at)
+
+
 class AdaptiveService:
     """
     Service for adaptive meal plan replanning.
@@ -34,6 +40,20 @@ class AdaptiveService:
         self.db = db
         self.fridge_service = FridgeService(db)
 
+    def _load_plan(self, user: User, plan_id: UUID) -> Optional[MealPlan]:
+        """
+        Load a user's plan with its meal slots and their recipes.
+
+        The slots and recipes are fetched in two extra queries up front rather
+        than one lazy load per slot when the plan is converted to a schema.
+        """
+        return (
+            self.db.query(MealPlan)
+            .options(selectinload(MealPlan.meals).selectinload(MealSlot.recipe))
+            .filter(MealPlan.id == plan_id, MealPlan.user_id == user.id)
+            .first()
+        )
+
     def adapt_plan(
         self,
         user: User,
@@ -52,11 +72,7 @@ class AdaptiveService:
             AdaptiveEngineOutput with new plan and adaptation summary
         """
         # Load the current plan
-        db_plan = (
-            self.db.query(MealPlan)
-            .filter(MealPlan.id == plan_id, MealPlan.user_id == user.id)
-            .first()
-        )
+        db_plan = self._load_plan(user, plan_id)
 
         if not db_plan:
             raise ValueError(f"Plan {plan_id} not found for user")
@@ -64,9 +80,6 @@ class AdaptiveService:
         # Convert to schema
         current_plan = db_meal_plan_to_schema(db_plan, self.db)
 
-        # Get fridge state
-        fridge_state = self.fridge_service.get_fridge_state(user)
-
         # Identify missed preps
         missed_preps = current_plan.get_missed_preps(current_date)
 
@@ -86,6 +99,9 @@ class AdaptiveService:
                 estimated_recovery_time_minutes=0,
             )
 
+        # Get fridge state (only needed once there is something to adapt)
+        fridge_state = self.fridge_service.get_fridge_state(user)
+
         # Load all recipes for adaptation
         db_recipes = (
             self.db.query(DBRecipe)
@@ -141,46 +157,51 @@ class AdaptiveService:
         # Remove existing meal slots for dates that changed
         changed_dates = {meal.date for meal in adapted_plan.meals}
 
-        # Delete old slots for changed dates
-        self.db.query(MealSlot).filter(
-            MealSlot.meal_plan_id == db_plan.id,
-            MealSlot.date.in_(changed_dates),
-            MealSlot.prep_status != PrepStatus.DONE,  # Don't delete completed meals
-        ).delete(synchronize_session=False)
+        # Index recipes by name; reversed so the first recipe with a name wins
+        recipe_by_name = {r.name: r for r in reversed(db_recipes)}
+
+        # Split the plan's current slots on those dates into completed meals,
+        # which are kept, and the rest, which the adapted meals replace
+        done_keys = set()
+        current_slots = Counter()
+        for slot in db_plan.meals:
+            if slot.date not in changed_dates:
+                continue
+            if slot.prep_status == PrepStatus.DONE:
+                done_keys.add((slot.date, slot.meal_type))
+            else:
+                current_slots[_slot_signature(slot)] += 1
 
-        # Add new meal slots
+        # Build new meal slots
+        new_slots: List[MealSlot] = []
         for schema_meal in adapted_plan.meals:
             # Skip if this meal is already marked done
-            existing_done = (
-                self.db.query(MealSlot)
-                .filter(
-                    MealSlot.meal_plan_id == db_plan.id,
-                    MealSlot.date == schema_meal.date,
-                    MealSlot.meal_type == schema_meal.meal_type,
-                    MealSlot.prep_status == PrepStatus.DONE,
-                )
-                .first()
-            )
-
-            if existing_done:
+            if (schema_meal.date, schema_meal.meal_type) in done_keys:
                 continue
 
             # Find matching recipe in database
-            db_recipe = next(
-                (r for r in db_recipes if r.name == schema_meal.recipe.name),
-                None
-            )
+            db_recipe = recipe_by_name.get(schema_meal.recipe.name)
 
             if db_recipe:
-                new_slot = MealSlot(
-                    meal_plan_id=db_plan.id,
-                    recipe_id=db_recipe.id,
-                    date=schema_meal.date,
-                    meal_type=schema_meal.meal_type,
-                    prep_status=schema_meal.prep_status,
-                    prep_completed_at=schema_meal.prep_completed_at,
+                new_slots.append(
+                    MealSlot(
+                        meal_plan_id=db_plan.id,
+                        recipe_id=db_recipe.id,
+                        date=schema_meal.date,
+                        meal_type=schema_meal.meal_type,
+                        prep_status=schema_meal.prep_status,
+                        prep_completed_at=schema_meal.prep_completed_at,
+                    )
                 )
-                self.db.add(new_slot)
+
+        # Only rewrite the slots if the adapted meals differ from the current ones
+        if Counter(_slot_signature(slot) for slot in new_slots) != current_slots:
+            self.db.query(MealSlot).filter(
+                MealSlot.meal_plan_id == db_plan.id,
+                MealSlot.date.in_(changed_dates),
+                MealSlot.prep_status != PrepStatus.DONE,  # Don't delete completed meals
+            ).delete(synchronize_session=False)
+            self.db.add_all(new_slots)
 
         # Update plan dates if needed
         db_plan.start_date = adapted_plan.start_date
@@ -207,17 +228,12 @@ class AdaptiveService:
             Dictionary with suggestions and priority ingredients
         """
         # Load the current plan
-        db_plan = (
-            self.db.query(MealPlan)
-            .filter(MealPlan.id == plan_id, MealPlan.user_id == user.id)
-            .first()
-        )
+        db_plan = self._load_plan(user, plan_id)
 
         if not db_plan:
             raise ValueError(f"Plan {plan_id} not found for user")
 
         current_plan = db_meal_plan_to_schema(db_plan, self.db)
-        fridge_state = self.fridge_service.get_fridge_state(user)
 
         # Get expiring items
         expiring_items = self.fridge_service.get_expiring_items(user, days_threshold=2)
@@ -241,7 +257,7 @@ class AdaptiveService:
                     "meal_type": meal.meal_type,
                     "recipe": meal.recipe.name,
                 }
-                for meal in current_plan.get_pending_meals()
+                for meal in current_plan.iter_pending_meals()
                 if meal.date >= current_date
             ],
             "needs_adaptation": len(missed_preps) > 0,
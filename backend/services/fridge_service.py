@@ -44,8 +44,9 @@ class FridgeService:
             .all()
         )
 
+        # Rows come straight from the database, so skip validation
         items = [
-            FridgeItem(
+            FridgeItem.model_construct(
                 ingredient_name=item.ingredient_name,
                 quantity=item.quantity,
                 days_remaining=item.days_remaining,
@@ -113,8 +113,14 @@ def _filter_recipes_by_diet_tag_and_meal_type(
 
 
 def db_recipe_to_schema(db_recipe: DBRecipe) -> Recipe:
-    """Convert database Recipe to Pydantic schema."""
-    return Recipe(
+    """
+    Convert database Recipe to Pydantic schema.
+
+    Recipe columns were validated on the way in, so the schema is built
+    without re-running validation. Ingredients are still validated because
+    their JSON is normalized by Ingredient's validator.
+    """
+    return Recipe.model_construct(
         id=str(db_recipe.id),
         name=db_recipe.name,
         diet_tags=db_recipe.diet_tags,
@@ -140,12 +146,12 @@ def schema_meal_plan_to_db(schema_plan: SchemaMealPlan, user: User, db: Session)
 
 
 def db_meal_plan_to_schema(db_plan: MealPlan, db: Session) -> SchemaMealPlan:
-    """Convert database MealPlan to Pydantic schema."""
+    """Convert database MealPlan to Pydantic schema without re-validating it."""
     # Load meals and convert to schema
     meals = []
     for db_slot in db_plan.meals:
         recipe = db_recipe_to_schema(db_slot.recipe)
-        meal_slot = SchemaMealSlot(
+        meal_slot = SchemaMealSlot.model_construct(
             date=db_slot.date,
             meal_type=db_slot.meal_type,
             recipe=recipe,
@@ -154,7 +160,7 @@ def db_meal_plan_to_schema(db_plan: MealPlan, db: Session) -> SchemaMealPlan:
         )
         meals.append(meal_slot)
 
-    return SchemaMealPlan(
+    return SchemaMealPlan.model_construct(
         id=db_plan.id,
         user_id=db_plan.user_id,
         diet_type=db_plan.diet_type,
@@ -167,11 +167,7 @@ class PDFService:
         story.append(Paragraph("Daily Meals", self.styles['SectionHeading']))
 
         # Group meals by date
-        meals_by_date = {}
-        for meal in schema_plan.meals:
-            if meal.date not in meals_by_date:
-                meals_by_date[meal.date] = []
-            meals_by_date[meal.date].append(meal)
+        meals_by_date = schema_plan.meals_by_date()
 
         for meal_date in sorted(meals_by_date.keys()):
             day_meals = meals_by_date[meal_date]
@@ -314,15 +310,9 @@ class PDFService:
 
         # Only show upcoming meals
         today = date.today()
-        upcoming_meals = [m for m in schema_plan.meals if m.date >= today]
+        meals_by_date = schema_plan.meals_by_date()
 
-        meals_by_date = {}
-        for meal in upcoming_meals:
-            if meal.date not in meals_by_date:
-                meals_by_date[meal.date] = []
-            meals_by_date[meal.date].append(meal)
-
-        for meal_date in sorted(meals_by_date.keys()):
+        for meal_date in sorted(d for d in meals_by_date if d >= today):
             day_meals = meals_by_date[meal_date]
             day_name = meal_date.strftime('%A, %B %d')
             story.append(Paragraph(day_name, self.styles['DayHeading']))
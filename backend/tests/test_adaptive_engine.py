@@ -5,7 +5,7 @@ import pytest
 from datetime import date, timedelta
 from uuid import uuid4
 
-from backend.models.schemas import DietType, AdaptiveEngineInput, PrepStatus
+from backend.models.schemas import DietType, AdaptiveEngineInput, PrepStatus, FridgeItem, FridgeState
 from backend.engine.meal_generator import MealGenerator
 from backend.engine.freshness_tracker import FreshnessTracker
 from backend.engine.adaptive_planner import AdaptivePlanner
@@ -248,5 +248,111 @@ class TestAdaptiveEngine:
                 assert alt.prep_time_minutes < complex_recipe.prep_time_minutes
 
 
+
+
+class TestFridgeState:
+    """Tests for FridgeState item lookup and updates."""
+
+    @staticmethod
+    def make_item(name, days=3):
+        return FridgeItem(
+            ingredient_name=name,
+            quantity="1",
+            days_remaining=days,
+            added_date=date.today(),
+            original_freshness_days=days,
+        )
+
+    def test_get_item_ignores_case(self):
+        """Lookups should match names regardless of case."""
+        fridge = FridgeState(user_id=uuid4(), items=[self.make_item("Spinach")])
+
+        assert fridge.get_item("spinach").ingredient_name == "Spinach"
+        assert fridge.get_item("kale") is None
+
+    def test_get_item_matches_unicode_case_variants(self):
+        """Lookups should casefold, so sharp s matches SS."""
+        fridge = FridgeState(user_id=uuid4(), items=[self.make_item("Weißkohl")])
+
+        assert fridge.get_item("WEISSKOHL") is fridge.items[0]
+
+    def test_add_item_replaces_existing_in_place(self):
+        """Adding a known ingredient should replace it without moving it."""
+        fridge = FridgeState(
+            user_id=uuid4(), items=[self.make_item("salmon"), self.make_item("spinach")]
+        )
+
+        fridge.add_item(self.make_item("Salmon", days=1))
+        fridge.add_item(self.make_item("kale"))
+
+        assert [item.ingredient_name for item in fridge.items] == ["Salmon", "spinach", "kale"]
+        assert fridge.get_item("salmon").days_remaining == 1
+        assert fridge.get_item("kale") is fridge.items[2]
+
+    def test_lookup_follows_direct_changes_to_items(self):
+        """Reassigning or removing from items should not leave stale lookups."""
+        fridge = FridgeState(user_id=uuid4(), items=[self.make_item("salmon")])
+        assert fridge.get_item("salmon") is not None
+
+        fridge.items.remove(fridge.get_item("salmon"))
+        assert fridge.get_item("salmon") is None
+
+        fridge.items = [self.make_item("kale")]
+        assert fridge.get_item("kale") is fridge.items[0]
+
+    def test_lookup_follows_same_length_changes_to_items(self):
+        """Removing and appending in place should not return the wrong item."""
+        fridge = FridgeState(
+            user_id=uuid4(), items=[self.make_item("salmon"), self.make_item("kale")]
+        )
+        assert fridge.get_item("kale") is fridge.items[1]
+
+        fridge.items.remove(fridge.items[0])
+        fridge.items.append(self.make_item("rice"))
+
+        assert fridge.get_item("kale") is fridge.items[0]
+        assert fridge.get_item("rice") is fridge.items[1]
+        assert fridge.get_item("salmon") is None
+
+
+class TestMealPlanMealsByDate:
+    """Tests for grouping MealPlan meals by date."""
+
+    @pytest.fixture
+    def plan(self):
+        return MealGenerator().generate_plan(
+            user_id=uuid4(),
+            diet_type=DietType.LOW_HISTAMINE,
+            start_date=date.today(),
+            days=3
+        )
+
+    def test_get_meals_by_date_matches_scan(self, plan):
+        """Grouped lookups should return the same meals as a scan."""
+        for offset in range(4):
+            target = date.today() + timedelta(days=offset)
+            expected = [meal for meal in plan.meals if meal.date == target]
+            assert plan.get_meals_by_date(target) == expected
+
+    def test_grouping_matches_scan(self, plan):
+        """Each date's group should hold that date's meals in plan order."""
+        for meal_date, meals in plan.meals_by_date().items():
+            assert meals == plan.get_meals_by_date(meal_date)
+
+    def test_grouping_follows_in_place_changes(self, plan):
+        """Meals changed in place should be grouped under their new date."""
+        today = date.today()
+        moved = plan.meals[0]
+        plan.meals_by_date()
+
+        moved.date = today + timedelta(days=10)
+        plan.meals[1] = plan.meals[1].model_copy(update={"date": today + timedelta(days=11)})
+
+        grouped = plan.meals_by_date()
+        assert grouped[today + timedelta(days=10)] == [moved]
+        assert grouped[today + timedelta(days=11)] == [plan.meals[1]]
+        assert moved not in plan.get_meals_by_date(today)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -4,8 +4,9 @@ Tests for CSRF protection middleware.
 Tests the Origin/Referer validation logic for state-changing requests.
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from starlette.testclient import TestClient
 from starlette.requests import Request
 
@@ -281,6 +282,22 @@ class TestCSRFMiddlewareConfiguration:
 
         assert "http://localhost:3000" in middleware.allowed_origins
 
+    def test_non_http_scopes_pass_through(self):
+        """Lifespan and websocket traffic should go straight to the app."""
+        app = AsyncMock()
+        middleware = CSRFMiddleware(
+            app,
+            allowed_origins=["http://localhost:3000"],
+            enabled=True,
+        )
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        asyncio.run(middleware(scope, receive, send))
+
+        app.assert_awaited_once_with(scope, receive, send)
+        send.assert_not_awaited()
+
     def test_exempt_paths_are_stored(self):
         """Exempt paths should be stored correctly."""
         middleware = CSRFMiddleware(
@@ -293,6 +310,19 @@ class TestCSRFMiddlewareConfiguration:
         assert "/health" in middleware.exempt_paths
         assert "/webhook/stripe" in middleware.exempt_paths
 
+    def test_exempt_paths_are_read_only(self):
+        """Exempt paths should be fixed at construction, not silently mutable."""
+        middleware = CSRFMiddleware(
+            MagicMock(),
+            allowed_origins=["http://localhost:3000"],
+            enabled=True,
+            exempt_paths=["/health"],
+        )
+
+        assert middleware.exempt_paths == frozenset({"/health"})
+        with pytest.raises(AttributeError):
+            middleware.exempt_paths = {"/webhook/"}
+
     def test_is_exempt_path_with_prefix_match(self):
         """Exempt path matching should use prefix matching."""
         middleware = CSRFMiddleware(
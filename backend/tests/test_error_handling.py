@@ -7,6 +7,7 @@ Tests cover:
 - Specific error messages for different failure scenarios
 - Error code propagation through the API
 """
+import pickle
 import pytest
 from datetime import date, timedelta
 from uuid import uuid4
@@ -20,6 +21,7 @@ from backend.errors import (
     InsufficientRecipesError,
     PlanGenerationError,
     PlanAdaptationError,
+    MealNotFoundError,
     FridgeItemNotFoundError,
     FridgeOperationError,
     EmailError,
@@ -111,6 +113,22 @@ class TestErrorResponse:
         assert response.error_code == ErrorCode.INTERNAL_ERROR
         assert response.details is None
 
+    def test_error_response_serializes_for_api(self):
+        """Should encode to the JSON shape FastAPI returns."""
+        from fastapi.encoders import jsonable_encoder
+
+        response = ErrorResponse(
+            error_code=ErrorCode.PLAN_NOT_FOUND,
+            message="Meal plan not found",
+            details={"plan_id": "123"},
+        )
+
+        assert jsonable_encoder(response) == {
+            "error_code": "PLAN_NOT_FOUND",
+            "message": "Meal plan not found",
+            "details": {"plan_id": "123"},
+        }
+
 
 class TestPrepPilotError:
     """Tests for base PrepPilotError exception."""
@@ -152,6 +170,48 @@ class TestPrepPilotError:
         assert error.details == {}
         assert error.status_code == 500
 
+    def test_error_fields_are_slots(self):
+        """Base error fields should be slot descriptors on PrepPilotError."""
+        error = PlanGenerationError(reason="boom")
+
+        assert error.status_code == 500
+        assert "status_code" not in error.__dict__
+        assert "status_code" in PrepPilotError.__slots__
+
+    def test_not_found_details_are_built_on_access(self):
+        """Not-found errors should defer their details dict until it is read."""
+        error = PlanNotFoundError(plan_id="abc")
+
+        assert error._details is None
+        assert error.details == {"plan_id": "abc"}
+        assert error.details is error.details
+
+    def test_not_found_message_is_formatted_on_access(self):
+        """Not-found errors should defer formatting their message."""
+        error = RecipeNotFoundError(recipe_id="abc")
+
+        assert error._message is None
+        assert str(error) == "Recipe 'abc' not found"
+        assert error.message == "Recipe 'abc' not found"
+
+    @pytest.mark.parametrize("error", [
+        PlanNotFoundError(plan_id="abc"),
+        PlanNotFoundError(plan_id="abc", message="Gone"),
+        MealNotFoundError(plan_id="abc", date="2024-01-01", meal_type="lunch"),
+        FridgeItemNotFoundError(item_id="abc"),
+        FridgeItemNotFoundError(ingredient_name="kale"),
+        RecipeNotFoundError(recipe_id="abc"),
+    ])
+    def test_not_found_errors_round_trip_through_pickle(self, error):
+        """Deferred-message errors should pickle and repr with their identifying data."""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.message == error.message
+        assert restored.details == error.details
+        assert restored.status_code == error.status_code
+        assert repr(error) == f"{type(error).__name__}({error.message!r})"
+
 
 class TestPlanExceptions:
     """Tests for plan-related exception classes."""
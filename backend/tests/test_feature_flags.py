@@ -89,6 +89,11 @@ class TestFeatureFlags:
 
         assert flags.get_flag(Feature.MEAL_SWAP) is False
 
+    def test_factory_function_shares_default_instance(self):
+        """get_feature_flags without overrides should reuse one instance."""
+        assert get_feature_flags() is get_feature_flags()
+        assert get_feature_flags(feature_meal_swap=False) is not get_feature_flags()
+
 
 class TestFeatureFlagService:
     """Tests for the FeatureFlagService."""
@@ -160,25 +165,30 @@ class TestFeatureFlagService:
         assert "meal_swap" in disabled
         assert "plan_duplication" not in disabled
 
+    def test_flag_states_are_cached_until_invalidated(self):
+        """Flag states should be read once and re-read after invalidate()."""
+        flags = FeatureFlags(feature_meal_swap=True)
+        service = FeatureFlagService(flags=flags)
+        assert service.is_enabled(Feature.MEAL_SWAP) is True
+
+        flags.feature_meal_swap = False
+        assert service.is_enabled(Feature.MEAL_SWAP) is True
+
+        service.invalidate()
+        assert service.is_enabled(Feature.MEAL_SWAP) is False
+
 
 class TestGetFeatureService:
     """Tests for the get_feature_service function."""
 
     def test_returns_service_instance(self):
         """get_feature_service should return a FeatureFlagService."""
-        # Reset global state for clean test
-        import backend.features.service as service_module
-        service_module._feature_service = None
-
         service = get_feature_service()
 
         assert isinstance(service, FeatureFlagService)
 
     def test_returns_singleton(self):
         """get_feature_service should return the same instance."""
-        import backend.features.service as service_module
-        service_module._feature_service = None
-
         service1 = get_feature_service()
         service2 = get_feature_service()
 
@@ -194,6 +204,11 @@ class TestRequireFeatureDependency:
 
         assert callable(dependency)
 
+    def test_dependency_factory_reuses_dependency_per_feature(self):
+        """require_feature should return the same dependency for a feature."""
+        assert require_feature(Feature.MEAL_SWAP) is require_feature(Feature.MEAL_SWAP)
+        assert require_feature(Feature.MEAL_SWAP) is not require_feature(Feature.EXPORT_PDF)
+
     @pytest.mark.asyncio
     async def test_dependency_passes_when_enabled(self):
         """The dependency should not raise when feature is enabled."""
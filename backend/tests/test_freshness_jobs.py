@@ -0,0 +1,192 @@
+"""
+Tests for the background freshness jobs.
+
+Tests the daily freshness decay and expiring item alerts against the
+test database.
+"""
+import pytest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.config import settings
+from backend.db.models import FridgeItem
+from backend.jobs.freshness_decay import (
+    decay_all_fridge_items,
+    remove_expired_items,
+    send_expiring_item_alerts,
+)
+
+
+@pytest.fixture
+def job_session(db_engine):
+    """Point the jobs' SessionLocal at the test database."""
+    with patch(
+        "backend.jobs.freshness_decay.SessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, bind=db_engine),
+    ):
+        yield
+
+
+class TestDecayAllFridgeItems:
+    """Tests for decay_all_fridge_items."""
+
+    def test_decrements_days_remaining(self, db_session, test_fridge_items, job_session):
+        """Every item should lose one day of freshness."""
+        before = {item.id: item.days_remaining for item in test_fridge_items}
+
+        decay_all_fridge_items()
+
+        db_session.expire_all()
+        for item in db_session.query(FridgeItem).all():
+            assert item.days_remaining == before[item.id] - 1
+
+    def test_decays_each_item_once_across_batches(
+        self, db_session, test_fridge_items, job_session
+    ):
+        """Items spread over several batches should each decay exactly once."""
+        before = {item.id: item.days_remaining for item in test_fridge_items}
+
+        with patch.object(settings, "freshness_decay_batch_size", 2):
+            decay_all_fridge_items()
+
+        db_session.expire_all()
+        for item in db_session.query(FridgeItem).all():
+            assert item.days_remaining == before[item.id] - 1
+
+    def test_does_not_go_below_zero(self, db_session, test_user, job_session):
+        """Items already at zero days should stay at zero."""
+        item = FridgeItem(
+            user_id=test_user.id,
+            ingredient_name="spinach",
+            quantity="1 bunch",
+            days_remaining=0,
+            added_date=date.today(),
+            original_freshness_days=5,
+        )
+        db_session.add(item)
+        db_session.commit()
+
+        decay_all_fridge_items()
+
+        db_session.expire_all()
+        assert db_session.get(FridgeItem, item.id).days_remaining == 0
+
+    def test_skips_inactive_users(self, db_session, inactive_user, job_session):
+        """Items belonging to inactive users should not decay."""
+        item = FridgeItem(
+            user_id=inactive_user.id,
+            ingredient_name="spinach",
+            quantity="1 bunch",
+            days_remaining=4,
+            added_date=date.today(),
+            original_freshness_days=5,
+        )
+        db_session.add(item)
+        db_session.commit()
+
+        decay_all_fridge_items()
+
+        db_session.expire_all()
+        assert db_session.get(FridgeItem, item.id).days_remaining == 4
+
+
+class TestRemoveExpiredItems:
+    """Tests for remove_expired_items."""
+
+    def test_removes_only_expired_items_across_batches(
+        self, db_session, test_user, test_fridge_items, job_session
+    ):
+        """Every item at zero days should be deleted, whatever the batch size."""
+        for name in ["spinach", "basil", "cream"]:
+            db_session.add(FridgeItem(
+                user_id=test_user.id,
+                ingredient_name=name,
+                quantity="1",
+                days_remaining=0,
+                added_date=date.today(),
+                original_freshness_days=3,
+            ))
+        db_session.commit()
+
+        with patch.object(settings, "expired_items_cleanup_batch_size", 2):
+            remove_expired_items()
+
+        db_session.expire_all()
+        remaining = {item.ingredient_name for item in db_session.query(FridgeItem).all()}
+        assert remaining == {item.ingredient_name for item in test_fridge_items}
+
+
+class TestSendExpiringItemAlerts:
+    """Tests for send_expiring_item_alerts."""
+
+    @pytest.fixture
+    def email_service(self):
+        service = MagicMock()
+        service.send_expiring_items_alert.return_value = True
+        with patch.object(settings, "email_enabled", True), patch(
+            "backend.jobs.freshness_decay.EmailService", return_value=service
+        ):
+            yield service
+
+    def test_sends_one_alert_per_user(
+        self, test_user, expiring_fridge_items, test_fridge_items, user_factory,
+        job_session, email_service,
+    ):
+        """Each user with expiring items should get one alert listing them."""
+        other_user = user_factory.create()
+        session = user_factory.db_session
+        session.add(FridgeItem(
+            user_id=other_user.id,
+            ingredient_name="basil",
+            quantity="1 bunch",
+            days_remaining=1,
+            added_date=date.today(),
+            original_freshness_days=3,
+        ))
+        session.commit()
+
+        send_expiring_item_alerts()
+
+        alerts = {
+            user.email: sorted(item.ingredient_name for item in items)
+            for (user, items), _ in email_service.send_expiring_items_alert.call_args_list
+        }
+        assert alerts == {
+            test_user.email: ["chicken breast", "milk", "salmon", "spinach"],
+            other_user.email: ["basil"],
+        }
+
+    def test_sends_every_alert_when_in_flight_limit_is_reached(
+        self, user_factory, job_session, email_service
+    ):
+        """Alerts beyond the in-flight limit should wait for a slot, not be dropped."""
+        session = user_factory.db_session
+        users = [user_factory.create() for _ in range(5)]
+        for user in users:
+            session.add(FridgeItem(
+                user_id=user.id,
+                ingredient_name="basil",
+                quantity="1 bunch",
+                days_remaining=1,
+                added_date=date.today(),
+                original_freshness_days=3,
+            ))
+        session.commit()
+
+        with patch.object(settings, "email_max_concurrency", 1):
+            send_expiring_item_alerts()
+
+        sent_to = {
+            user.email for (user, _), _ in email_service.send_expiring_items_alert.call_args_list
+        }
+        assert sent_to == {user.email for user in users}
+
+    def test_no_alert_without_expiring_items(
+        self, test_user, job_session, email_service
+    ):
+        """Users with nothing expiring soon should not be emailed."""
+        send_expiring_item_alerts()
+
+        email_service.send_expiring_items_alert.assert_not_called()
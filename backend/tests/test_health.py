@@ -6,6 +6,16 @@ Tests the application's observability endpoints.
 import pytest
 from unittest.mock import patch, MagicMock
 
+import backend.main
+
+
+@pytest.fixture(autouse=True)
+def reset_health_cache():
+    """Start each test without a cached database ping."""
+    backend.main._health_cache["ts"] = float("-inf")
+    yield
+    backend.main._health_cache["ts"] = float("-inf")
+
 
 class TestRootEndpoint:
     """Tests for the root / endpoint."""
@@ -142,6 +152,32 @@ class TestHealthCheckWithDatabaseFailure:
             # to allow load balancers to read the response
             assert response.status_code == 200
 
+    def test_recent_result_is_reused(self, client):
+        """Calls within the cache window should not ping the database again."""
+        with patch("backend.main.SessionLocal") as mock_session_local:
+            mock_session = MagicMock()
+            mock_session.execute.side_effect = Exception("Connection refused")
+            mock_session_local.return_value = mock_session
+
+            first = client.get("/health").json()
+            second = client.get("/health").json()
+
+            assert mock_session.execute.call_count == 1
+            assert second == first
+
+    def test_first_call_pings_right_after_boot(self, client):
+        """The first call should ping even when the monotonic clock is near zero."""
+        with patch("backend.main.SessionLocal") as mock_session_local, \
+                patch("backend.main.time.monotonic", return_value=0.5):
+            mock_session = MagicMock()
+            mock_session.execute.side_effect = Exception("Connection refused")
+            mock_session_local.return_value = mock_session
+
+            data = client.get("/health").json()
+
+            assert mock_session.execute.call_count == 1
+            assert data["status"] == "unhealthy"
+
 
 class TestDocsEndpoint:
     """Tests for OpenAPI documentation endpoints."""
@@ -609,6 +609,39 @@ class TestAdaptMealPlan:
         assert response.status_code == 403
 
 
+class TestUpdateDbPlan:
+    """Tests for persisting an adapted plan in AdaptiveService._update_db_plan."""
+
+    def test_unchanged_meals_keep_their_slots(self, db_session, test_meal_plan, test_recipe):
+        """An adapted plan identical to the current one should not rewrite slots."""
+        from backend.services.adaptive_service import AdaptiveService
+        from backend.services.meal_service import db_meal_plan_to_schema
+
+        slot_ids = {slot.id for slot in test_meal_plan.meals}
+        adapted = db_meal_plan_to_schema(test_meal_plan, db_session)
+
+        AdaptiveService(db_session)._update_db_plan(test_meal_plan, adapted, [test_recipe])
+
+        assert {slot.id for slot in test_meal_plan.meals} == slot_ids
+
+    def test_changed_meals_replace_slots(self, db_session, test_meal_plan, test_recipe):
+        """Dropping a meal from the adapted plan should remove its slot."""
+        from backend.services.adaptive_service import AdaptiveService
+        from backend.services.meal_service import db_meal_plan_to_schema
+
+        adapted = db_meal_plan_to_schema(test_meal_plan, db_session)
+        adapted.meals = [
+            meal for meal in adapted.meals
+            if not (meal.date == date.today() and meal.meal_type == "lunch")
+        ]
+
+        AdaptiveService(db_session)._update_db_plan(test_meal_plan, adapted, [test_recipe])
+
+        today_types = {slot.meal_type for slot in test_meal_plan.meals if slot.date == date.today()}
+        assert today_types == {"breakfast", "dinner"}
+        assert len(test_meal_plan.meals) == 20
+
+
 class TestPrepTimeline:
     """Tests for GET /api/plans/{plan_id}/prep-timeline."""
 
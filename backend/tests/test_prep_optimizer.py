@@ -308,6 +308,15 @@ class TestPrepOptimizer:
         for step in multi_source_steps:
             assert len(step.source_recipes) >= 2
 
+    def test_batched_totals_are_consistent(self, optimizer, multi_meal_plan):
+        """Total time should be the sum of emitted steps and savings non-negative."""
+        today = date.today()
+        timeline = optimizer.optimize_meal_prep(multi_meal_plan, today)
+
+        assert timeline.total_time_minutes == sum(s.duration_minutes for s in timeline.steps)
+        for step in timeline.steps:
+            assert len(step.source_recipes) == len(set(step.source_recipes))
+
     # Step Numbering Tests
 
     def test_steps_are_numbered_sequentially(self, optimizer, single_meal_plan):
@@ -318,6 +327,64 @@ class TestPrepOptimizer:
         for i, step in enumerate(timeline.steps):
             assert step.step_number == i + 1
 
+    # Multi-Recipe Parsing Tests
+
+    def test_parses_all_recipes_in_one_parser_call(self, multi_meal_plan):
+        """All recipes for the day should go to the parser together."""
+        heuristic = HeuristicStepParser()
+        calls = []
+
+        class RecordingParser:
+            def parse_step(self, step, context):
+                return heuristic.parse_step(step, context)
+
+            def parse_steps(self, steps, context):
+                return heuristic.parse_steps(steps, context)
+
+            def parse_recipes(self, recipes):
+                calls.append([context["recipe_name"] for _, context in recipes])
+                return heuristic.parse_recipes(recipes)
+
+        optimizer = PrepOptimizer(parser=RecordingParser())
+        timeline = optimizer.optimize_meal_prep(multi_meal_plan, date.today())
+
+        assert calls == [["Chicken Salad", "Vegetable Soup"]]
+        assert len(timeline.steps) > 0
+
+    def test_repeated_recipes_are_parsed_once(self, multi_meal_plan):
+        """Recipes parsed earlier by the optimizer should not be parsed again."""
+        heuristic = HeuristicStepParser()
+        calls = []
+
+        class RecordingParser:
+            def parse_recipes(self, recipes):
+                calls.append([context["recipe_name"] for _, context in recipes])
+                return heuristic.parse_recipes(recipes)
+
+        optimizer = PrepOptimizer(parser=RecordingParser())
+        first = optimizer.optimize_meal_prep(multi_meal_plan, date.today())
+        second = optimizer.optimize_meal_prep(multi_meal_plan, date.today())
+
+        assert calls == [["Chicken Salad", "Vegetable Soup"]]
+        assert second == first
+
+        # An edited recipe is parsed again
+        recipe = multi_meal_plan.meals[0].recipe
+        recipe.prep_steps = recipe.prep_steps + ["Serve chilled."]
+        optimizer.optimize_meal_prep(multi_meal_plan, date.today())
+
+        assert calls[1] == [recipe.name]
+
+    def test_precompute_is_noop_without_batch_support(self, optimizer, multi_meal_plan):
+        """Parsers without a Batch API path should not be asked to precompute."""
+        assert optimizer.precompute_meal_plans([multi_meal_plan]) == 0
+
+    def test_extract_action_verb_skips_adverbs_and_punctuation(self, optimizer):
+        """Action verb fallback should skip adverbs and trailing punctuation."""
+        assert optimizer._extract_action_verb("Finely, chop the onion.") == "chop"
+        assert optimizer._extract_action_verb("Gently: stir.") == "stir"
+        assert optimizer._extract_action_verb("Go on") == "prepare"
+
 
 class TestPrepOptimizerEdgeCases:
     """Edge case tests for PrepOptimizer."""
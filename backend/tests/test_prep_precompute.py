@@ -0,0 +1,63 @@
+"""
+Tests for the background prep parsing precompute job.
+
+Tests that plans are only loaded when the parser can use the Batch API,
+and that the database session is released before the batch is submitted.
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.engine.parsing.heuristic import HeuristicStepParser
+from backend.engine.prep_optimizer import PrepOptimizer
+from backend.jobs.prep_precompute import precompute_prep_parsing
+
+
+@pytest.fixture
+def job_sessions(db_engine):
+    """Point the job's SessionLocal at the test database and record each session."""
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    sessions = []
+
+    def open_session():
+        session = factory()
+        session.close = MagicMock(wraps=session.close)
+        sessions.append(session)
+        return session
+
+    with patch("backend.jobs.prep_precompute.SessionLocal", side_effect=open_session):
+        yield sessions
+
+
+class TestPrecomputePrepParsing:
+    """Tests for precompute_prep_parsing."""
+
+    def test_skips_query_without_batch_support(self, test_meal_plan, job_sessions):
+        """Plans should not be loaded when the parser has no Batch API path."""
+        optimizer = PrepOptimizer(parser=HeuristicStepParser())
+
+        with patch("backend.jobs.prep_precompute.PrepOptimizer", return_value=optimizer), \
+                patch.object(optimizer, "precompute_meal_plans") as precompute:
+            precompute_prep_parsing()
+
+        assert job_sessions == []
+        precompute.assert_not_called()
+
+    def test_releases_session_before_precompute(self, test_meal_plan, job_sessions):
+        """The session should be closed before the batch is submitted."""
+        optimizer = MagicMock(supports_batch=True)
+
+        def precompute(meal_plans):
+            assert len(job_sessions) == 1
+            job_sessions[0].close.assert_called_once()
+            assert not job_sessions[0].in_transaction()
+            assert [plan.id for plan in meal_plans] == [test_meal_plan.id]
+            return 1
+
+        optimizer.precompute_meal_plans.side_effect = precompute
+
+        with patch("backend.jobs.prep_precompute.PrepOptimizer", return_value=optimizer):
+            precompute_prep_parsing()
+
+        optimizer.precompute_meal_plans.assert_called_once()
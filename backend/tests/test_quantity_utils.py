@@ -0,0 +1,88 @@
+"""
+Tests for ingredient quantity parsing and combining.
+
+Tests parse_quantity, normalize_to_base_unit, combine_quantities and reduce_quantity.
+"""
+import pytest
+
+from backend.engine.quantity_utils import (
+    parse_quantity,
+    normalize_to_base_unit,
+    can_combine_quantities,
+    combine_quantities,
+    reduce_quantity,
+)
+
+
+class TestParseQuantity:
+    """Tests for parse_quantity."""
+
+    @pytest.mark.parametrize("quantity,expected", [
+        ("500g", (500.0, "g", "500g")),
+        ("2 cups", (2.0, "cups", "2 cups")),
+        ("1/2 cup", (0.5, "cup", "1/2 cup")),
+        ("1 large", (1.0, "large", "1 large")),
+        ("2-3 medium", (2.5, "medium", "2-3 medium")),
+        ("1.5 kg", (1.5, "kg", "1.5 kg")),
+        ("  3 Tbsp ", (3.0, "tbsp", "3 Tbsp")),
+        ("4", (4.0, "unit", "4")),
+    ])
+    def test_parses_documented_formats(self, quantity, expected):
+        """Should parse numbers, fractions, ranges and units."""
+        assert parse_quantity(quantity) == expected
+
+    def test_text_without_number_is_one_unit(self):
+        """Quantities without a number should count as one of the whole text."""
+        assert parse_quantity("Pinch") == (1.0, "pinch", "Pinch")
+
+    def test_malformed_amount_defaults_to_one(self):
+        """Amounts that aren't valid numbers should fall back to 1."""
+        assert parse_quantity("1/0 cup") == (1.0, "cup", "1/0 cup")
+        assert parse_quantity("1.2.3 g") == (1.0, "g", "1.2.3 g")
+
+
+class TestNormalizeToBaseUnit:
+    """Tests for normalize_to_base_unit."""
+
+    def test_weight_converts_to_grams(self):
+        assert normalize_to_base_unit(2.0, "kg") == (2000.0, "g")
+
+    def test_volume_converts_to_ml(self):
+        assert normalize_to_base_unit(2.0, "tsp") == pytest.approx((9.86, "ml"))
+
+    def test_unit_case_and_spacing_are_ignored(self):
+        assert normalize_to_base_unit(1.0, " G ") == (1.0, "g")
+
+    def test_other_units_are_counts(self):
+        assert normalize_to_base_unit(3.0, "cloves") == (3.0, "count")
+
+
+class TestCombineQuantities:
+    """Tests for combine_quantities and can_combine_quantities."""
+
+    def test_compatible_units_are_summed(self):
+        assert combine_quantities("500g", "1kg") == "1.5kg"
+        assert combine_quantities("200 ml", "100ml") == "300ml"
+        assert combine_quantities("2 cloves", "3 cloves") == "5 cloves"
+
+    def test_incompatible_units_are_concatenated(self):
+        assert not can_combine_quantities("g", "ml")
+        assert combine_quantities("500g", "2 cups") == "500g + 2 cups"
+
+
+class TestReduceQuantity:
+    """Tests for reduce_quantity."""
+
+    def test_reduces_by_fraction(self):
+        assert reduce_quantity("500g") == "250g"
+        assert reduce_quantity("3 cloves", 0.5) == "1.5 cloves"
+        assert reduce_quantity("4 pieces", 0.25) == "3 pieces"
+
+    def test_only_base_unit_spellings_are_abbreviated(self):
+        """Grams and ml collapse to g/ml; other weights keep their unit."""
+        assert reduce_quantity("300 grams") == "150g"
+        assert reduce_quantity("500 milliliters") == "250ml"
+        assert reduce_quantity("2 kg") == "1 kg"
+
+    def test_fully_used_is_zero(self):
+        assert reduce_quantity("2 cups", 1.0) == "0"
@@ -0,0 +1,115 @@
+"""
+Tests for client-side OpenAI rate limiting.
+
+Tests the RateLimiter token buckets and how OpenAIClient reports outcomes to it.
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from backend.clients.openai_client import OpenAIClient, OpenAIClientError
+from backend.clients.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("backend.clients.rate_limiter.time") as mock_time:
+        mock_time.monotonic.side_effect = fake.monotonic
+        mock_time.sleep.side_effect = fake.sleep
+        yield fake
+
+
+class TestRateLimiter:
+    """Tests for the request and token buckets."""
+
+    def test_requests_within_limits_do_not_wait(self, clock):
+        """Requests that fit in both buckets should go straight through."""
+        limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=1000)
+
+        for _ in range(3):
+            limiter.acquire(100)
+
+        assert clock.sleeps == []
+
+    def test_waits_when_requests_run_out(self, clock):
+        """An empty request bucket should wait for one request's refill."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100000)
+        for _ in range(60):
+            limiter.acquire(10)
+
+        limiter.acquire(10)
+
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_waits_when_tokens_run_out(self, clock):
+        """A request larger than the remaining tokens should wait for them."""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=600)
+        limiter.acquire(600)
+
+        limiter.acquire(300)
+
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    def test_rate_limited_halves_request_rate(self, clock):
+        """A 429 should halve the request rate and pause until it refills."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100000)
+
+        limiter.record_rate_limited()
+        limiter.acquire(10)
+
+        assert clock.sleeps == [pytest.approx(2.0)]
+
+    def test_success_recovers_request_rate(self, clock):
+        """Successful calls should raise the rate back toward the configured limit."""
+        limiter = RateLimiter(requests_per_minute=4, tokens_per_minute=1000)
+        limiter.record_rate_limited()
+
+        for _ in range(5):
+            limiter.record_success()
+
+        assert limiter._requests_per_minute == 4
+
+
+class TestOpenAIClientRateLimiting:
+    """Tests for how OpenAIClient uses the rate limiter."""
+
+    @pytest.fixture
+    def client(self):
+        client = OpenAIClient()
+        client._rate_limiter = MagicMock()
+        client._client = MagicMock()
+        client._initialized = True
+        return client
+
+    def test_acquires_before_each_request(self, client):
+        """Requests should wait for the limiter with an estimate from prompt length."""
+        client.complete("s" * 400, "u" * 400)
+
+        client._rate_limiter.acquire.assert_called_once_with(200)
+        client._rate_limiter.record_success.assert_called_once()
+
+    def test_reports_429_to_limiter(self, client):
+        """A 429 from the API should slow the limiter down."""
+        error = Exception("Too many requests")
+        error.status_code = 429
+        client._client.chat.completions.create.side_effect = error
+
+        with pytest.raises(OpenAIClientError):
+            client.complete("system", "user")
+
+        client._rate_limiter.record_rate_limited.assert_called_once()
@@ -8,7 +8,14 @@ and passive step identification for both heuristic and LLM parsers.
 import pytest
 from unittest.mock import MagicMock, patch
 
+from backend.clients.openai_client import (
+    OpenAIClient,
+    OpenAIClientError,
+    _iter_json_array_items,
+)
+from backend.config import settings
 from backend.engine.parsing.heuristic import HeuristicStepParser
+from backend.engine.parsing.llm import SYSTEM_PROMPT_VERSION, LLMStepParser
 from backend.engine.parsing.models import Equipment, ParsedPrepStep, Phase
 from backend.engine.parsing.cache import StepParsingCache
 
@@ -95,6 +102,13 @@ class TestHeuristicStepParser:
         result = parser.parse_step(step, default_context)
         assert result.ingredient == "onion"
 
+    def test_extracts_ingredient_after_matched_keyword(self, parser, default_context):
+        """Should read the ingredient after the keyword that set the action."""
+        step = "Stir the rice into the infused milk mixture."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "mix"
+        assert result.ingredient == "rice"
+
     # Equipment Detection Tests
 
     def test_detects_oven_equipment(self, parser, default_context):
@@ -187,6 +201,17 @@ class TestHeuristicStepParser:
         result = parser.parse_step(step, default_context)
         assert result.duration_minutes == 3
 
+    def test_batch_durations_stay_within_their_step(self, parser):
+        """Should attribute explicit times to the step that states them."""
+        steps = [
+            "Braise for 1 hour, then simmer 20 minutes.",
+            "Roast for 2 hours.",
+            "Chop the parsley 5",
+            "minutes before serving, garnish.",
+        ]
+        results = parser.parse_steps(steps, {"recipe_total_time": 60})
+        assert [r.duration_minutes for r in results] == [20, 120, 3, 2]
+
     # Batch Key Tests
 
     def test_generates_batch_key_for_batchable_step(self, parser, default_context):
@@ -203,6 +228,29 @@ class TestHeuristicStepParser:
         assert result.can_batch is False
         assert result.get_batch_key() is None
 
+    # Descriptive Text Tests
+
+    def test_detects_descriptive_starter(self, parser, default_context):
+        """Known explanatory starters should be marked descriptive."""
+        step = "The apples will soften and roast, providing a tart compote."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "descriptive"
+        assert result.duration_minutes == 0
+
+    def test_detects_descriptive_verb_after_the(self, parser, default_context):
+        """'The X provides ...' sentences should be marked descriptive."""
+        step = "The roasted fennel provides a mellow sweetness."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "descriptive"
+
+    def test_actionable_step_starting_with_the_is_not_descriptive(
+        self, parser, default_context
+    ):
+        """A 'The ...' step without a descriptive verb is still actionable."""
+        step = "The onions should be diced finely."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "chop"
+
     # Parse Source Tests
 
     def test_parse_source_is_heuristic(self, parser, default_context):
@@ -228,6 +276,19 @@ class TestHeuristicStepParser:
         assert results[1].action_type == "simmer"
         assert results[2].action_type == "serve"
 
+    def test_repeated_steps_reuse_cached_classification(self, parser):
+        """Duplicate steps should hit the classification cache but keep raw text."""
+        context = {"recipe_name": "Test", "recipe_total_time": 20}
+        parser.parse_steps(["Dice the onion finely."], context)
+        hits_before = HeuristicStepParser._classify.cache_info().hits
+
+        results = parser.parse_steps(["DICE THE ONION FINELY."], context)
+
+        assert HeuristicStepParser._classify.cache_info().hits == hits_before + 1
+        assert results[0].action_type == "chop"
+        assert results[0].ingredient == "onion"
+        assert results[0].raw_step == "DICE THE ONION FINELY."
+
     # Real Recipe Step Tests (from low_histamine_recipes.json)
 
     def test_real_step_crack_cardamom(self, parser, default_context):
@@ -248,8 +309,20 @@ class TestHeuristicStepParser:
         """Test parsing: 'Peel and cube the tart green apple.'"""
         step = "Peel and cube the tart green apple."
         result = parser.parse_step(step, default_context)
-        # cube normalizes to chop, which appears first in keyword search
-        assert result.action_type == "chop"
+        # The leading verb wins over later keywords in the step
+        assert result.action_type == "peel"
+
+    def test_real_step_sear_lamb_chops(self, parser, default_context):
+        """'chops' as a noun should not outrank the leading verb."""
+        step = "Sear lamb chops for 3 minutes per side to develop a crust."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "fry"
+
+    def test_compound_keyword_outranks_substring(self, parser, default_context):
+        """'preheat oven' should win over the shorter 'heat ' keyword."""
+        step = "Preheat oven to 400°F."
+        result = parser.parse_step(step, default_context)
+        assert result.action_type == "preheat"
 
     def test_real_step_dice_rutabaga(self, parser, default_context):
         """Test parsing: 'Dice rutabaga into small 1cm cubes for even cooking.'"""
@@ -293,34 +366,46 @@ class TestStepParsingCache:
 
     def test_cache_miss_returns_none(self, cache):
         """Should return None for cache miss."""
-        result = cache.get("recipe_123", "Chop onion")
+        result = cache.get("Chop onion", "v1")
         assert result is None
 
     def test_cache_set_and_get(self, cache, sample_step):
         """Should store and retrieve cached step."""
-        cache.set("recipe_123", "Dice the onion finely.", sample_step)
-        result = cache.get("recipe_123", "Dice the onion finely.")
+        cache.set("Dice the onion finely.", "v1", sample_step)
+        result = cache.get("Dice the onion finely.", "v1")
 
         assert result is not None
         assert result.action_type == "chop"
         assert result.ingredient == "onion"
 
-    def test_cache_different_recipe_ids(self, cache, sample_step):
-        """Same step text with different recipe IDs should be separate entries."""
-        cache.set("recipe_1", "Chop onion", sample_step)
+    def test_cache_ignores_case_and_spacing(self, cache, sample_step):
+        """The same step written differently should share an entry."""
+        cache.set("Dice the onion finely.", "v1", sample_step)
 
-        # Different recipe ID should miss
-        result = cache.get("recipe_2", "Chop onion")
+        assert cache.get("  dice the ONION  finely.", "v1") is sample_step
+
+    def test_cache_different_prompt_versions(self, cache, sample_step):
+        """Same step text under different prompt versions should be separate entries."""
+        cache.set("Chop onion", "v1", sample_step)
+
+        # Different prompt version should miss
+        result = cache.get("Chop onion", "v2")
         assert result is None
 
-        # Same recipe ID should hit
-        result = cache.get("recipe_1", "Chop onion")
+        # Same prompt version should hit
+        result = cache.get("Chop onion", "v1")
         assert result is not None
 
+    def test_cache_get_many(self, cache, sample_step):
+        """Should look up several steps in order."""
+        cache.set("Chop onion", "v1", sample_step)
+
+        assert cache.get_many(["Rinse rice", "Chop onion"], "v1") == [None, sample_step]
+
     def test_cache_clear(self, cache, sample_step):
         """Should clear all entries."""
-        cache.set("recipe_1", "Step 1", sample_step)
-        cache.set("recipe_2", "Step 2", sample_step)
+        cache.set("Step 1", "v1", sample_step)
+        cache.set("Step 2", "v1", sample_step)
 
         assert cache.size == 2
         cache.clear()
@@ -330,13 +415,275 @@ class TestStepParsingCache:
         """Should track cache size correctly."""
         assert cache.size == 0
 
-        cache.set("r1", "s1", sample_step)
+        cache.set("s1", "v1", sample_step)
         assert cache.size == 1
 
-        cache.set("r2", "s2", sample_step)
+        cache.set("s2", "v1", sample_step)
         assert cache.size == 2
 
 
+class TestLLMStepParser:
+    """Tests for LLMStepParser with a mocked OpenAI client."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create an LLM parser with a mock client and a private cache."""
+        parser = LLMStepParser()
+        parser._client = MagicMock()
+        parser._cache = StepParsingCache(ttl_hours=1)
+        return parser
+
+    @staticmethod
+    def _llm_step(recipe_index, step_index, action_type, ingredient):
+        return {
+            "recipe_index": recipe_index,
+            "step_index": step_index,
+            "action_type": action_type,
+            "ingredient": ingredient,
+            "duration_minutes": 3,
+            "equipment": "prep_area",
+            "is_passive": False,
+            "can_batch": True,
+            "phase": "prep",
+        }
+
+    def test_parses_several_recipes_with_one_call(self, parser):
+        """Steps from all recipes should share a single LLM request."""
+        parser._client.stream_json_items.return_value = [
+            self._llm_step(0, 0, "chop", "onion"),
+            self._llm_step(1, 0, "wash", "rice"),
+            self._llm_step(0, 1, "chop", "garlic"),
+        ]
+        recipes = [
+            (["Dice the onion.", "Mince the garlic."], {"recipe_id": "r1", "recipe_name": "Soup"}),
+            (["Rinse the rice."], {"recipe_id": "r2", "recipe_name": "Pilaf"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        assert parser._client.stream_json_items.call_count == 1
+        assert [[p.ingredient for p in steps] for steps in results] == [
+            ["onion", "garlic"],
+            ["rice"],
+        ]
+        assert all(p.parse_source == "llm" for steps in results for p in steps)
+
+    def test_missing_steps_fall_back_to_heuristics(self, parser):
+        """Steps the LLM skipped should be parsed heuristically."""
+        parser._client.stream_json_items.return_value = [self._llm_step(0, 0, "chop", "onion")]
+        recipes = [
+            (["Dice the onion."], {"recipe_id": "r1"}),
+            (["Rinse the rice."], {"recipe_id": "r2"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        assert results[0][0].parse_source == "llm"
+        assert results[1][0].parse_source == "heuristic"
+        assert results[1][0].action_type == "wash"
+
+    def test_cached_recipes_skip_the_llm(self, parser):
+        """Only recipes with uncached steps should be sent to the LLM."""
+        parser._client.stream_json_items.return_value = [self._llm_step(0, 0, "wash", "rice")]
+        parser._cache.set(
+            "Dice the onion.", SYSTEM_PROMPT_VERSION,
+            HeuristicStepParser().parse_step("Dice the onion.", {}),
+        )
+        recipes = [
+            (["Dice the onion."], {"recipe_id": "r1"}),
+            (["Rinse the rice."], {"recipe_id": "r2", "recipe_name": "Pilaf"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        user_prompt = parser._client.stream_json_items.call_args.kwargs["user_prompt"]
+        assert "Rinse the rice." in user_prompt
+        assert "Dice the onion." not in user_prompt
+        assert results[1][0].ingredient == "rice"
+        assert parser._cache.get("Rinse the rice.", SYSTEM_PROMPT_VERSION) is results[1][0]
+
+    def test_reuses_cached_step_from_another_recipe(self, parser):
+        """A step parsed for one recipe should be served from cache for another."""
+        parser._client.stream_json_items.return_value = [self._llm_step(0, 0, "chop", "onion")]
+        parser.parse_steps(["Dice the onion."], {"recipe_id": "r1"})
+
+        result = parser.parse_steps(["dice the onion."], {"recipe_id": "r2"})[0]
+
+        assert parser._client.stream_json_items.call_count == 1
+        assert result.ingredient == "onion"
+        assert result.raw_step == "dice the onion."
+
+    def test_api_error_falls_back_to_heuristics(self, parser):
+        """A failed request should fall back for every recipe it covered."""
+        parser._client.stream_json_items.side_effect = OpenAIClientError("boom")
+        recipes = [
+            (["Dice the onion."], {"recipe_id": "r1"}),
+            (["Rinse the rice."], {"recipe_id": "r2"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        assert [steps[0].parse_source for steps in results] == ["heuristic", "heuristic"]
+
+    def test_null_equipment_and_phase_use_defaults(self, parser):
+        """Null equipment or phase from the LLM should map to the defaults."""
+        step_data = {**self._llm_step(0, 0, "chop", "onion"), "equipment": None, "phase": None}
+        parser._client.stream_json_items.return_value = [step_data]
+
+        result = parser.parse_steps(["Dice the onion."], {"recipe_id": "r1"})[0]
+
+        assert result.parse_source == "llm"
+        assert result.equipment == Equipment.PREP_AREA
+        assert result.phase == Phase.PREP
+
+    def test_repeated_steps_are_sent_once(self, parser):
+        """A step repeated across recipes should be sent once and shared."""
+        parser._client.stream_json_items.return_value = [
+            self._llm_step(0, 0, "chop", "onion"),
+            self._llm_step(1, 0, "wash", "rice"),
+        ]
+        recipes = [
+            (["Dice the onion."], {"recipe_id": "r1"}),
+            (["Rinse the rice.", "dice the  onion."], {"recipe_id": "r2"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        user_prompt = parser._client.stream_json_items.call_args.kwargs["user_prompt"]
+        assert user_prompt.lower().count("onion") == 1
+        assert results[1][1].ingredient == "onion"
+        assert results[1][1].raw_step == "dice the  onion."
+
+    def test_confident_heuristic_steps_skip_the_llm(self, parser):
+        """Steps the heuristic parser is sure of should not be sent to the LLM."""
+        parser._client.stream_json_items.return_value = [
+            self._llm_step(0, 0, "chop", "onion")
+        ]
+        steps = ["Preheat oven to 400°F.", "Dice the onion.", "Serve warm."]
+
+        results = parser.parse_steps(steps, {"recipe_id": "r1"})
+
+        user_prompt = parser._client.stream_json_items.call_args.kwargs["user_prompt"]
+        assert "Dice the onion." in user_prompt
+        assert "Preheat oven" not in user_prompt
+        assert [p.parse_source for p in results] == ["heuristic", "llm", "heuristic"]
+        assert results[1].ingredient == "onion"
+
+    def test_all_confident_steps_make_no_llm_call(self, parser):
+        """A recipe the heuristic parser fully handles needs no LLM request."""
+        results = parser.parse_steps(["Preheat oven to 400°F.", "Let rest 5 minutes."], {})
+
+        parser._client.stream_json_items.assert_not_called()
+        assert [p.action_type for p in results] == ["preheat", "rest"]
+
+    def test_non_streaming_setting_uses_parse_json(self, parser):
+        """With streaming disabled, requests should wait for the whole JSON reply."""
+        parser._client.parse_json.return_value = {
+            "parsed_steps": [self._llm_step(0, 0, "chop", "onion")]
+        }
+
+        with patch.object(settings, "openai_stream_responses", False):
+            result = parser.parse_steps(["Dice the onion."], {"recipe_id": "r1"})[0]
+
+        parser._client.stream_json_items.assert_not_called()
+        assert result.ingredient == "onion"
+
+    def test_malformed_stream_falls_back_to_heuristics(self, parser):
+        """A response that breaks off mid-stream should fall back for the whole request."""
+        def broken_stream(**kwargs):
+            yield self._llm_step(0, 0, "chop", "onion")
+            raise OpenAIClientError("JSON response ended inside the 'parsed_steps' array")
+
+        parser._client.stream_json_items.side_effect = broken_stream
+        recipes = [
+            (["Dice the onion."], {"recipe_id": "r1"}),
+            (["Rinse the rice."], {"recipe_id": "r2"}),
+        ]
+
+        results = parser.parse_recipes(recipes)
+
+        assert [steps[0].parse_source for steps in results] == ["heuristic", "heuristic"]
+
+    def test_batch_api_results_are_cached(self, parser):
+        """Batch API results should be converted and cached like live ones."""
+        parser._client.parse_json_batch.return_value = {
+            "0": {"parsed_steps": [self._llm_step(0, 0, "chop", "onion")]}
+        }
+
+        results = parser.parse_recipes_batch([(["Dice the onion."], {"recipe_id": "r1"})])
+
+        system_prompt, user_prompts = parser._client.parse_json_batch.call_args.args
+        assert list(user_prompts) == ["0"]
+        assert results[0][0].ingredient == "onion"
+        assert parser._cache.get("Dice the onion.", SYSTEM_PROMPT_VERSION) is results[0][0]
+        parser._client.stream_json_items.assert_not_called()
+
+
+class TestStreamingJsonItems:
+    """Tests for decoding a JSON array as its text arrives."""
+
+    def test_yields_items_split_across_chunks(self):
+        """Items should decode correctly however the text is chunked."""
+        text = '{"parsed_steps": [{"ingredient": "on}ion"}, {"ingredient": "rice"}]}'
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+
+        items = list(_iter_json_array_items(chunks, "parsed_steps"))
+
+        assert items == [{"ingredient": "on}ion"}, {"ingredient": "rice"}]
+
+    def test_truncated_array_raises(self):
+        """Text that ends inside the array should raise after the complete items."""
+        items = _iter_json_array_items(['{"parsed_steps": [{"a": 1}, {"b"'], "parsed_steps")
+
+        assert next(items) == {"a": 1}
+        with pytest.raises(OpenAIClientError):
+            next(items)
+
+
+    def test_stream_reads_through_to_usage_chunk(self):
+        """The stream should be read past the array so its usage chunk is seen."""
+        def chunk(content=None, usage=None):
+            choices = [MagicMock(delta=MagicMock(content=content))] if content else []
+            return MagicMock(choices=choices, usage=usage)
+
+        usage = MagicMock(prompt_tokens=1200, completion_tokens=80)
+        usage.prompt_tokens_details.cached_tokens = 1024
+        stream = [chunk('{"parsed_steps": [{"a": 1}'), chunk("]}"), chunk(usage=usage)]
+        client = OpenAIClient()
+        client._client = MagicMock()
+        client._client.chat.completions.create.return_value = iter(stream)
+        client._initialized = True
+        client._rate_limiter = None
+
+        with patch("backend.clients.openai_client.logger") as mock_logger:
+            items = list(client.stream_json_items("system", "user", key="parsed_steps"))
+
+        assert items == [{"a": 1}]
+        assert "1024 cached" in mock_logger.debug.call_args.args[0]
+
+
+class TestOpenAIClientBatch:
+    """Tests for the Batch API round trip in OpenAIClient."""
+
+    def test_batch_jsonl_round_trip(self):
+        """Requests should be uploaded as JSONL and results decoded by custom_id."""
+        client = OpenAIClient()
+        client._client = MagicMock()
+        client._initialized = True
+        batch = MagicMock(id="batch_1", status="completed", output_file_id="file_out")
+        client._client.batches.create.return_value = batch
+        client._client.files.content.return_value.content = (
+            b'{"custom_id": "0", "response": {"status_code": 200, "body": {"choices": '
+            b'[{"message": {"content": "{\\"parsed_steps\\": []}"}}]}}}\n'
+            b'{"custom_id": "1", "response": {"status_code": 500}, "error": "boom"}\n'
+        )
+
+        results = client.parse_json_batch("system", {"0": "first", "1": "second"})
+
+        uploaded = client._client.files.create.call_args.kwargs["file"][1]
+        assert [line.count(b'"custom_id"') for line in uploaded.split(b"\n")] == [1, 1]
+        assert results == {"0": {"parsed_steps": []}}
+
 class TestParsedPrepStep:
     """Tests for ParsedPrepStep dataclass."""
 
@@ -355,6 +702,13 @@ class TestParsedPrepStep:
         )
         assert step.get_batch_key() == "chop_onion"
 
+    def test_uses_slots(self):
+        """Steps should not carry a per-instance __dict__."""
+        step = HeuristicStepParser().parse_step("Chop onion", {})
+        assert not hasattr(step, "__dict__")
+        with pytest.raises(AttributeError):
+            step.notes = "extra"
+
     def test_get_batch_key_without_ingredient(self):
         """Should return action_type as batch key when no ingredient."""
         step = ParsedPrepStep(